@@ -113,7 +113,7 @@ from .utils import (
     LFSR,
     
     # ファクトリ関数
-    create_mame_volume_table,
+    create_ym_volume_table,
     create_default_lfsr,
 )
 
@@ -190,7 +190,7 @@ __all__ = [
     "create_debug_core",
     
     # ユーティリティファクトリ関数
-    "create_mame_volume_table",
+    "create_ym_volume_table",
     "create_default_lfsr",
     
     # 音声出力クラス
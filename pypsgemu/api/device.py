@@ -110,6 +110,36 @@ class AY38910Device(Device, AudioDevice):
             self._core.write_register(address, value)
         except Exception as e:
             raise DeviceError(f"Register write failed at address {address}: {e}") from e
+
+    def write_registers(self, register_values: Dict[int, int]) -> None:
+        """
+        複数レジスタの一括書き込み
+
+        パッチ適用などの複数書き込みを1回の呼び出しにまとめる
+        バッチ版write。アドレス昇順に適用するため、R13書き込みによる
+        エンベロープリセットなどの副作用順序は決定的です。
+
+        Args:
+            register_values: {アドレス: 値} の辞書
+
+        Raises:
+            DeviceError: 無効なアドレスまたは値が含まれる場合
+        """
+        # 先に全エントリを検証し、エラー時にデバイスが中途半端に
+        # 更新された状態にならないようにする
+        for address, value in register_values.items():
+            if not (0 <= address < self._register_count):
+                raise DeviceError(f"Register address {address} out of range [0, {self._register_count-1}]")
+
+            if not (0 <= value <= 255):
+                raise DeviceError(f"Register value {value} out of range [0, 255]")
+
+        core_write = self._core.write_register
+        for address in sorted(register_values):
+            try:
+                core_write(address, register_values[address])
+            except Exception as e:
+                raise DeviceError(f"Register write failed at address {address}: {e}") from e
     
     def get_state(self) -> Dict[str, Any]:
         """
@@ -13,7 +13,7 @@ def demo_main(args: Optional[List[str]] = None) -> int:
     """デモプログラムのメインエントリーポイント"""
     parser = argparse.ArgumentParser(
         description='AY-3-8910 PSG Emulator Demo',
-        prog='pypsgemu-demo'
+        prog='pypsgemu demo'
     )
     parser.add_argument(
         '--example', 
@@ -68,7 +68,7 @@ def debug_main(args: Optional[List[str]] = None) -> int:
     """デバッグUIのメインエントリーポイント"""
     parser = argparse.ArgumentParser(
         description='AY-3-8910 PSG Emulator Debug UI',
-        prog='pypsgemu-debug'
+        prog='pypsgemu debug'
     )
     parser.add_argument(
         '--tool',
@@ -118,7 +118,7 @@ def test_main(args: Optional[List[str]] = None) -> int:
     """テストランナーのメインエントリーポイント"""
     parser = argparse.ArgumentParser(
         description='AY-3-8910 PSG Emulator Test Runner',
-        prog='pypsgemu-test'
+        prog='pypsgemu test'
     )
     parser.add_argument(
         '--suite',
@@ -166,6 +166,47 @@ def test_main(args: Optional[List[str]] = None) -> int:
         return 1
 
 
+# サブコマンド名 → エントリーポイントのディスパッチテーブル
+_SUBCOMMANDS = {
+    'demo': demo_main,
+    'debug': debug_main,
+    'test': test_main,
+}
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """統合CLIのメインエントリーポイント
+
+    `pypsgemu <subcommand>` 形式でdemo/debug/testへディスパッチします。
+    console_scriptsのエントリを1つに集約することで、環境内の
+    エントリーポイント列挙コストを削減します。
+
+    Args:
+        args: コマンドライン引数（Noneの場合はsys.argv[1:]）
+
+    Returns:
+        終了コード
+    """
+    if args is None:
+        args = sys.argv[1:]
+
+    if not args or args[0] in ('-h', '--help'):
+        print("usage: pypsgemu {demo,debug,test} [options]")
+        print()
+        print("subcommands:")
+        print("  demo   デモプログラムを実行")
+        print("  debug  デバッグツールを起動")
+        print("  test   テストスイートを実行")
+        return 0 if args else 2
+
+    handler = _SUBCOMMANDS.get(args[0])
+    if handler is None:
+        print(f"pypsgemu: unknown subcommand '{args[0]}' "
+              f"(choose from {', '.join(_SUBCOMMANDS)})", file=sys.stderr)
+        return 2
+
+    return handler(args[1:])
+
+
 if __name__ == '__main__':
-    # 直接実行された場合はデモを実行
-    sys.exit(demo_main())
+    sys.exit(main())
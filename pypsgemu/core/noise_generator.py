@@ -6,8 +6,10 @@ AY-3-8910 PSG エミュレータ - ノイズジェネレータ
 """
 
 from typing import Optional
+import numpy as np
 from .types import InvalidValueError, MAX_NOISE_PERIOD
 from ..utils.lfsr import LFSR
+from ..utils.lfsr_numba import generate_noise_bits
 
 
 class NoiseGenerator:
@@ -232,24 +234,17 @@ class NoiseGenerator:
         """
         return self._lfsr.predict_next_output()
     
-    def generate_noise_sequence(self, length: int) -> list[bool]:
+    def generate_noise_sequence(self, length: int) -> 'np.ndarray':
         """ノイズシーケンスを生成（状態は変更しない）
-        
+
         Args:
             length: 生成するシーケンスの長さ
-            
+
         Returns:
-            ノイズビットのリスト
+            ノイズビットのuint8配列 (0/1)
         """
-        # 現在の状態を保存
-        lfsr_copy = self._lfsr.copy()
-        
-        # シーケンスを生成
-        sequence = []
-        for _ in range(length):
-            sequence.append(lfsr_copy.step())
-        
-        return sequence
+        # 現在のLFSR値を起点にバッチカーネルで一括生成
+        return generate_noise_bits(self._lfsr.get_value(), length)
     
     def copy(self) -> 'NoiseGenerator':
         """ノイズジェネレータの深いコピーを作成
@@ -400,7 +395,7 @@ def test_lfsr_randomness(generator: NoiseGenerator, sample_size: int = 10000) ->
     sequence = generator.generate_noise_sequence(sample_size)
     
     # 基本統計
-    ones_count = sum(sequence)
+    ones_count = int(np.count_nonzero(sequence))
     zeros_count = sample_size - ones_count
     ones_ratio = ones_count / sample_size
     
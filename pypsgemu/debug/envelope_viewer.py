@@ -264,10 +264,20 @@ class EnvelopeViewer:
         self.level_line = self.ax.axhline(y=15, color='r', linestyle='--', alpha=0.7, label='Current Level')
         
         self.ax.legend()
-        
-        # 初期表示
+
+        # レイアウト計算は初期表示とリサイズ時のみ実行
+        # （per-frameの更新パスでは呼ばないこと — 全アーティスト走査が走る）
         self.figure.tight_layout()
+        self.canvas.mpl_connect('resize_event', self._on_resize)
         self.canvas.draw()
+
+    def _on_resize(self, event):
+        """リサイズ時にレイアウトを再計算"""
+        try:
+            self.figure.tight_layout()
+        except Exception:
+            # リサイズ中の一時的な極小サイズでは失敗することがある
+            pass
     
     def _on_shape_change(self):
         """エンベロープ形状変更"""
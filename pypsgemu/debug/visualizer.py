@@ -5,6 +5,7 @@ AY-3-8910エミュレータの17ビットLFSR状態のリアルタイム表示
 ノイズアルゴリズム検証機能と2進数表示、ビット変化の可視化を実装しています。
 """
 
+import numpy as np
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Any, Optional, List
@@ -120,8 +121,15 @@ class LFSRBitDisplay:
         
         # 統計変数
         self.change_count = 0
-        self.value_history = []
         self.period_detected = None
+
+        # 値履歴（int32配列 + 有効長で管理、最大周期の約1.5倍を保持）
+        self._hist = np.empty(200000, dtype=np.int32)
+        self._hist_n = 0
+
+        # ハイライト減衰制御（単一のafterタイマーで全ビットを掃引）
+        self._highlight_expiry = np.zeros(self.bit_count, dtype=np.float64)
+        self._sweep_scheduled = False
     
     def update_value(self, new_value: int) -> None:
         """LFSR値を更新
@@ -165,10 +173,10 @@ class LFSRBitDisplay:
             
             # 色を設定
             if (changed_bits >> bit_index) & 1:
-                # 変化したビット
+                # 変化したビット（減衰は単一の掃引タイマーで処理）
                 bg_color = self.colors['bit_changed']
-                # 少し後で通常色に戻す
-                self.parent.after(200, lambda l=label, v=bit_value: self._set_normal_color(l, v))
+                self._highlight_expiry[i] = time.monotonic() + 0.2
+                self._schedule_sweep()
             else:
                 # 通常のビット
                 bg_color = self.colors['bit_1'] if bit_value else self.colors['bit_0']
@@ -189,6 +197,30 @@ class LFSRBitDisplay:
         if self.period_detected:
             self.period_label.config(text=str(self.period_detected))
     
+    def _schedule_sweep(self):
+        """ハイライト掃引タイマーを登録（保留中なら何もしない）"""
+        if not self._sweep_scheduled:
+            self._sweep_scheduled = True
+            self.parent.after(100, self._sweep_highlights)
+
+    def _sweep_highlights(self):
+        """期限切れのハイライトを通常色に戻す（10Hzの単一タイマー）"""
+        self._sweep_scheduled = False
+        now = time.monotonic()
+        still_pending = False
+
+        for i in np.nonzero(self._highlight_expiry > 0.0)[0]:
+            if now >= self._highlight_expiry[i]:
+                self._highlight_expiry[i] = 0.0
+                bit_index = self.bit_count - 1 - i
+                bit_value = (self.current_value >> bit_index) & 1
+                self._set_normal_color(self.bit_labels[i], bit_value)
+            else:
+                still_pending = True
+
+        if still_pending:
+            self._schedule_sweep()
+
     def _set_normal_color(self, label: tk.Label, bit_value: int):
         """通常色に戻す
         
@@ -205,53 +237,55 @@ class LFSRBitDisplay:
         Args:
             value: 現在の値
         """
-        self.value_history.append(value)
-        
-        # 履歴が長すぎる場合は古いものを削除
-        if len(self.value_history) > 200000:  # 最大周期の約1.5倍
-            self.value_history = self.value_history[-100000:]
-        
+        # 履歴が満杯の場合は後半のみ残す
+        if self._hist_n >= len(self._hist):
+            np.copyto(self._hist[:100000], self._hist[self._hist_n - 100000:self._hist_n])
+            self._hist_n = 100000
+
+        self._hist[self._hist_n] = value
+        self._hist_n += 1
+
         # 周期検出（簡易版）
-        if len(self.value_history) > 1000:  # 十分なデータがある場合
-            # 最初の値と同じ値を探す
-            first_value = self.value_history[0]
-            for i in range(100, len(self.value_history)):
-                if self.value_history[i] == first_value:
-                    # 周期候補を検証
-                    period_candidate = i
-                    if self._verify_period(period_candidate):
-                        self.period_detected = period_candidate
-                        break
-    
+        if self._hist_n > 1000:  # 十分なデータがある場合
+            # 最初の値と一致する位置を周期候補として抽出（ベクトル演算）
+            first_value = self._hist[0]
+            candidates = np.nonzero(self._hist[100:self._hist_n] == first_value)[0] + 100
+            for period_candidate in candidates:
+                if self._verify_period(int(period_candidate)):
+                    self.period_detected = int(period_candidate)
+                    break
+
     def _verify_period(self, period: int) -> bool:
         """周期を検証
-        
+
         Args:
             period: 検証する周期
-            
+
         Returns:
             周期が正しい場合True
         """
-        if period <= 0 or period >= len(self.value_history):
+        if period <= 0 or period >= self._hist_n:
             return False
-        
-        # 最初の数サイクルを比較
-        cycles_to_check = min(3, len(self.value_history) // period)
-        
+
+        # 最初の数サイクルをスライス比較（C側で実行）
+        cycles_to_check = min(3, self._hist_n // period)
+        compare_len = min(period, 100)  # 最初の100個を比較
+
         for cycle in range(1, cycles_to_check):
-            for i in range(min(period, 100)):  # 最初の100個を比較
-                if (cycle * period + i) >= len(self.value_history):
-                    break
-                
-                if self.value_history[i] != self.value_history[cycle * period + i]:
-                    return False
-        
+            offset = cycle * period
+            length = min(compare_len, self._hist_n - offset)
+            if length <= 0:
+                break
+
+            if not np.array_equal(self._hist[:length], self._hist[offset:offset + length]):
+                return False
+
         return True
     
     def reset_statistics(self):
         """統計情報をリセット"""
         self.change_count = 0
-        self.value_history.clear()
+        self._hist_n = 0
         self.period_detected = None
         
         self.changes_label.config(text="0")
@@ -279,6 +313,14 @@ class LFSRVisualizer:
         self._stop_update = threading.Event()
         self._update_interval = 0.05  # 20Hz更新
         self._is_running = False
+
+        # idleディスパッチ制御（最新値スロット + 保留フラグ）
+        self._latest_lfsr = None
+        self._idle_pending = False
+
+        # ローカルLFSR予測（デバイスポーリングの頻度を下げる）
+        self._local_lfsr = None
+        self._resync_interval = 10  # Nフレームごとにデバイスと再同期
         
         # UI作成
         if parent is None:
@@ -422,22 +464,55 @@ AY-3-8910 Noise Generator LFSR:
     
     def _update_loop(self):
         """更新ループ"""
+        frame = 0
         while not self._stop_update.is_set() and self._is_running:
             try:
-                # デバイスからLFSR状態を取得
-                state = self.device.get_state()
-                if 'lfsr_value' in state:
-                    lfsr_value = state['lfsr_value']
-                    
-                    # UI更新（メインスレッドで実行）
-                    if self.parent:
-                        self.parent.after_idle(lambda v=lfsr_value: self.lfsr_display.update_value(v))
-                
+                if self._local_lfsr is None or frame % self._resync_interval == 0:
+                    # Nフレームに1回だけデバイスをポーリングしてドリフトを補正
+                    state = self.device.get_state()
+                    if 'lfsr_value' in state:
+                        self._local_lfsr = state['lfsr_value']
+                else:
+                    # それ以外のフレームはローカルにLFSRを進める
+                    self._local_lfsr = self._step_local_lfsr(self._local_lfsr)
+
+                if self._local_lfsr is not None:
+                    # 最新値スロットに書き込み、保留中でなければidle処理を1件だけ登録
+                    # （lambdaの生成を避け、idleキューの肥大化を防ぐ）
+                    self._latest_lfsr = self._local_lfsr
+                    if self.parent and not self._idle_pending:
+                        self._idle_pending = True
+                        self.parent.after_idle(self._drain_idle_update)
+
             except Exception as e:
                 print(f"LFSR update error: {e}")
-            
+
+            frame += 1
             time.sleep(self._update_interval)
-    
+
+    @staticmethod
+    def _step_local_lfsr(value: int) -> int:
+        """LFSR値をローカルに1ステップ進める
+
+        コア実装（utils.lfsr.LFSR）と同じフィードバック多項式
+        x^17 + x^14 + 1（bit0 XOR bit14）を使用します。
+
+        Args:
+            value: 現在の17ビットLFSR値
+
+        Returns:
+            1ステップ後のLFSR値
+        """
+        feedback_bit = (value ^ (value >> 14)) & 1
+        return ((value >> 1) | (feedback_bit << 16)) & 0x1FFFF
+
+    def _drain_idle_update(self):
+        """idleキューから最新のLFSR値を反映（メインスレッドで実行）"""
+        self._idle_pending = False
+        value = self._latest_lfsr
+        if value is not None:
+            self.lfsr_display.update_value(value)
+
     def _update_status(self, message: str):
         """ステータス更新"""
         noise_period = self.noise_period_var.get()
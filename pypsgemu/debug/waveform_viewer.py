@@ -6,9 +6,6 @@ AY-3-8910エミュレータの3チャンネル出力波形オシロスコープ
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import ttk
 from typing import List, Optional, Dict, Any
@@ -48,6 +45,9 @@ class WaveformBuffer:
         # 統計情報
         self.sample_count = 0
         self.last_update_time = 0.0
+
+        # 未描画データの有無（再描画の要否判定に使用）
+        self.dirty = False
     
     def add_samples(self, samples: List[float], timestamp: float = None) -> None:
         """サンプルを追加
@@ -69,6 +69,7 @@ class WaveformBuffer:
         self.time_buffer.append(timestamp)
         self.sample_count += 1
         self.last_update_time = timestamp
+        self.dirty = True
     
     def get_channel_data(self, channel: int) -> tuple:
         """チャンネルデータを取得
@@ -84,10 +85,13 @@ class WaveformBuffer:
         
         if len(self.buffers[channel]) == 0:
             return np.array([]), np.array([])
-        
-        time_array = np.array(list(self.time_buffer))
-        amplitude_array = np.array(list(self.buffers[channel]))
-        
+
+        # fromiterで中間リストを生成せずに直接配列へ書き込む
+        time_array = np.fromiter(self.time_buffer, dtype=np.float64,
+                                 count=len(self.time_buffer))
+        amplitude_array = np.fromiter(self.buffers[channel], dtype=np.float32,
+                                      count=len(self.buffers[channel]))
+
         return time_array, amplitude_array
     
     def get_all_data(self) -> Dict[str, np.ndarray]:
@@ -99,8 +103,10 @@ class WaveformBuffer:
         if len(self.time_buffer) == 0:
             return {'time': np.array([]), 'channels': [np.array([]) for _ in range(self.channels)]}
         
-        time_array = np.array(list(self.time_buffer))
-        channel_arrays = [np.array(list(buffer)) for buffer in self.buffers]
+        time_array = np.fromiter(self.time_buffer, dtype=np.float64,
+                                 count=len(self.time_buffer))
+        channel_arrays = [np.fromiter(buffer, dtype=np.float32, count=len(buffer))
+                          for buffer in self.buffers]
         
         return {
             'time': time_array,
@@ -113,6 +119,7 @@ class WaveformBuffer:
             buffer.clear()
         self.time_buffer.clear()
         self.sample_count = 0
+        self.dirty = False
     
     def get_statistics(self) -> Dict[str, Any]:
         """統計情報を取得
@@ -165,6 +172,9 @@ class WaveformViewer:
         self._stop_update = threading.Event()
         self._update_interval = 0.02  # 50Hz更新
         self._is_running = False
+
+        # idleディスパッチ制御（保留フラグで再描画を1件に集約）
+        self._idle_pending = False
         
         # UI作成
         if parent is None:
@@ -232,10 +242,13 @@ class WaveformViewer:
         plot_frame = ttk.LabelFrame(main_frame, text="Waveform Display", padding=5)
         plot_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Matplotlibフィギュア
-        self.figure = Figure(figsize=(10, 6), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # 波形描画用キャンバス（Tk Canvas直描画）
+        # Matplotlibのレンダリングパイプラインを経由せず、
+        # create_line/coordsのみで波形を更新します。
+        self.canvas = tk.Canvas(plot_frame, bg='black', highlightthickness=0,
+                               width=760, height=400)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', self._on_canvas_resize)
         
         # ステータス表示
         self.status_label = ttk.Label(main_frame, text="Ready")
@@ -243,33 +256,91 @@ class WaveformViewer:
     
     def _setup_plot(self):
         """プロットを設定"""
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_xlabel('Time (s)')
-        self.ax.set_ylabel('Amplitude')
-        self.ax.set_title('AY-3-8910 Waveform')
-        self.ax.grid(True, alpha=0.3)
-        
+        # 描画領域サイズ（リサイズ時に更新）
+        self._plot_width = 760
+        self._plot_height = 400
+
+        # 座標変換用の作業バッファ（チャンネルごとに確保し、全フレームで再利用）
+        self._allocate_xy_buffers()
+
+        # 静的要素（グリッド・ラベル）は一度だけ描画
+        self._grid_ids = []
+        self._draw_grid()
+
         # 各チャンネルのライン
-        self.lines = []
+        self.line_ids = []
         for i in range(3):
-            line, = self.ax.plot([], [], color=self.channel_colors[i], 
-                               label=self.channel_names[i], linewidth=1.5)
-            self.lines.append(line)
-        
-        self.ax.legend()
-        self.ax.set_ylim(-1.1, 1.1)
-        
-        # 初期表示
-        self.figure.tight_layout()
-        self.canvas.draw()
-    
+            line_id = self.canvas.create_line(0, 0, 0, 0,
+                                             fill=self.channel_colors[i], width=1)
+            self.line_ids.append(line_id)
+
+    def _allocate_xy_buffers(self):
+        """座標変換バッファをバッファ上限サイズで確保"""
+        max_samples = self.waveform_buffer.max_samples
+        self._xy_buffers: List[np.ndarray] = [
+            np.empty((max_samples, 2), dtype=np.int32) for _ in range(3)
+        ]
+
+    def _draw_grid(self):
+        """グリッドと凡例を描画（静的要素）"""
+        for item_id in self._grid_ids:
+            self.canvas.delete(item_id)
+        self._grid_ids.clear()
+
+        width = self._plot_width
+        height = self._plot_height
+
+        # 振幅グリッド線（-1.0, -0.5, 0.0, +0.5, +1.0）
+        for amplitude in (-1.0, -0.5, 0.0, 0.5, 1.0):
+            y = self._amplitude_to_y(amplitude)
+            color = '#666666' if amplitude == 0.0 else '#333333'
+            line_id = self.canvas.create_line(0, y, width, y, fill=color)
+            self._grid_ids.append(line_id)
+
+            text_id = self.canvas.create_text(4, y - 2, text=f"{amplitude:+.1f}",
+                                             fill='#888888', anchor=tk.SW,
+                                             font=("Courier", 7))
+            self._grid_ids.append(text_id)
+
+        # チャンネル凡例
+        for i in range(3):
+            text_id = self.canvas.create_text(width - 8, 12 + i * 14,
+                                             text=self.channel_names[i],
+                                             fill=self.channel_colors[i],
+                                             anchor=tk.E, font=("Courier", 8))
+            self._grid_ids.append(text_id)
+
+        # グリッドはラインの背面に配置
+        for item_id in self._grid_ids:
+            self.canvas.tag_lower(item_id)
+
+    def _amplitude_to_y(self, amplitude: float) -> float:
+        """振幅をY座標に変換
+
+        Args:
+            amplitude: 振幅値（-1.1〜1.1を表示範囲とする）
+
+        Returns:
+            キャンバスY座標
+        """
+        y_center = self._plot_height / 2.0
+        return y_center - (amplitude / 1.1) * y_center
+
+    def _on_canvas_resize(self, event):
+        """キャンバスリサイズ処理"""
+        self._plot_width = max(event.width, 1)
+        self._plot_height = max(event.height, 1)
+        self._draw_grid()
+        # 座標系が変わったため強制的に再描画
+        self.waveform_buffer.dirty = True
+        self._update_plot()
+
     def _on_channel_toggle(self):
         """チャンネル表示切り替え"""
         for i, var in enumerate(self.channel_vars):
             self.channel_enabled[i] = var.get()
-            self.lines[i].set_visible(self.channel_enabled[i])
-        
-        self.canvas.draw()
+            state = tk.NORMAL if self.channel_enabled[i] else tk.HIDDEN
+            self.canvas.itemconfigure(self.line_ids[i], state=state)
     
     def _on_time_window_change(self):
         """時間窓変更"""
@@ -281,6 +352,7 @@ class WaveformViewer:
                 # バッファサイズを再計算
                 max_samples = int(self.sample_rate * self.window_duration * 2)
                 self.waveform_buffer = WaveformBuffer(max_samples, channels=3)
+                self._allocate_xy_buffers()
                 
         except Exception as e:
             print(f"Time window change error: {e}")
@@ -320,9 +392,8 @@ class WaveformViewer:
     
     def _clear_plot(self):
         """プロットをクリア"""
-        for line in self.lines:
-            line.set_data([], [])
-        self.canvas.draw()
+        for line_id in self.line_ids:
+            self.canvas.coords(line_id, 0, 0, 0, 0)
     
     def _update_loop(self):
         """更新ループ"""
@@ -334,20 +405,30 @@ class WaveformViewer:
                 # サンプルをバッファに追加
                 self.waveform_buffer.add_samples(channel_outputs)
                 
-                # プロット更新（メインスレッドで実行）
-                if self.parent:
-                    self.parent.after_idle(self._update_plot)
-                
+                # プロット更新（メインスレッドで実行、保留中なら登録しない）
+                if self.parent and not self._idle_pending:
+                    self._idle_pending = True
+                    self.parent.after_idle(self._drain_idle_update)
+
             except Exception as e:
                 print(f"Waveform update error: {e}")
-            
+
             time.sleep(self._update_interval)
+
+    def _drain_idle_update(self):
+        """idleキューからプロット更新を実行（メインスレッドで実行）"""
+        self._idle_pending = False
+        self._update_plot()
     
     def _update_plot(self):
         """プロットを更新"""
         try:
+            # 未描画データがなければ再描画しない（一時停止中のCPU消費をゼロに）
+            if not self.waveform_buffer.dirty:
+                return
+
             data = self.waveform_buffer.get_all_data()
-            
+
             if len(data['time']) == 0:
                 return
             
@@ -361,21 +442,54 @@ class WaveformViewer:
                 return
             
             filtered_time = relative_time[mask]
-            
-            # 各チャンネルのデータを更新
+
+            # 各チャンネルのラインを更新（coords呼び出し1回のみ）
             for i in range(3):
                 if self.channel_enabled[i] and len(data['channels'][i]) > 0:
                     filtered_amplitude = data['channels'][i][mask]
-                    self.lines[i].set_data(filtered_time, filtered_amplitude)
-            
-            # 軸範囲を更新
-            self.ax.set_xlim(-self.window_duration, 0)
-            
-            # 描画
-            self.canvas.draw_idle()
-            
+                    coords = self._to_canvas_coords(i, filtered_time, filtered_amplitude)
+                    if coords is not None:
+                        self.canvas.coords(self.line_ids[i], *coords)
+
+            self.waveform_buffer.dirty = False
+
         except Exception as e:
             print(f"Plot update error: {e}")
+
+    def _to_canvas_coords(self, channel: int, time_data: np.ndarray,
+                          amplitude_data: np.ndarray) -> Optional[list]:
+        """波形データをキャンバス座標列に変換
+
+        再利用可能なバッファに (x, y) をインターリーブで書き込み、
+        coords()に渡せるフラットなリストを返します。
+
+        Args:
+            channel: チャンネル番号
+            time_data: 相対時間データ（-window_duration〜0）
+            amplitude_data: 振幅データ
+
+        Returns:
+            [x0, y0, x1, y1, ...] 形式の座標リスト（データ不足時はNone）
+        """
+        n = min(len(time_data), len(amplitude_data))
+        if n < 2:
+            return None
+
+        buf = self._xy_buffers[channel]
+        if len(buf) < n:
+            # 外部データ（plot_waveform）がバッファ上限を超える場合のみ拡張
+            buf = np.empty((n, 2), dtype=np.int32)
+            self._xy_buffers[channel] = buf
+
+        xy = buf[:n]
+        x_scale = self._plot_width / self.window_duration
+        y_center = self._plot_height / 2.0
+
+        # 時間→X座標、振幅→Y座標（ベクトル演算でint32バッファに直接書き込み）
+        xy[:, 0] = (time_data[:n] + self.window_duration) * x_scale
+        xy[:, 1] = y_center - (amplitude_data[:n] / 1.1) * y_center
+
+        return xy.ravel().tolist()
     
     def _update_status(self, message: str):
         """ステータス更新"""
@@ -400,15 +514,18 @@ class WaveformViewer:
             amplitude_data: 各チャンネルの振幅データ
         """
         try:
+            if len(time_data) == 0:
+                return
+
+            # 表示窓の右端に合わせた相対時間に変換
+            relative_time = time_data - time_data[-1]
+
             for i, amplitude in enumerate(amplitude_data):
-                if i < len(self.lines) and self.channel_enabled[i]:
-                    self.lines[i].set_data(time_data, amplitude)
-            
-            if len(time_data) > 0:
-                self.ax.set_xlim(time_data[0], time_data[-1])
-            
-            self.canvas.draw()
-            
+                if i < len(self.line_ids) and self.channel_enabled[i]:
+                    coords = self._to_canvas_coords(i, relative_time, amplitude)
+                    if coords is not None:
+                        self.canvas.coords(self.line_ids[i], *coords)
+
         except Exception as e:
             raise WaveformViewerError(f"Failed to plot waveform: {e}")
     
@@ -4,12 +4,47 @@ AY-3-8910 PSG Emulator - GUI Entry Point
 GUIアプリケーションのメインエントリーポイントを提供します。
 """
 
+import datetime
+import queue
 import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
 
 
+# 静的なシステム情報文字列（初回要求時に一度だけ構築）
+# platform.platform()はOSによってはサブプロセスを起動するため毎回呼ばない
+_STATIC_INFO: Optional[str] = None
+
+
+def _get_static_info() -> str:
+    """静的なシステム情報文字列を取得（キャッシュ付き）"""
+    global _STATIC_INFO
+    if _STATIC_INFO is None:
+        import platform
+        import pypsgemu
+
+        _STATIC_INFO = "\n".join([
+            f"PyPSGEmu Version: {getattr(pypsgemu, '__version__', '1.0.0')}",
+            f"Python Version: {sys.version}",
+            f"Platform: {platform.platform()}",
+            "",
+            "利用可能な機能:",
+            "- AY-3-8910 完全エミュレーション",
+            "- リアルタイム音声出力",
+            "- デバッグ・可視化ツール",
+            "- 状態管理・スナップショット",
+            "- 包括的なテストスイート",
+            "",
+            "使用方法:",
+            "1. 上記のボタンでツールやサンプルを起動",
+            "2. デバッグUIでリアルタイム制御",
+            "3. 各種ビューアで内部状態を可視化",
+        ])
+    return _STATIC_INFO
+
+
 class PyPSGEmuGUI:
     """PyPSGEmu GUI メインアプリケーション"""
     
@@ -22,9 +57,19 @@ class PyPSGEmuGUI:
         # デバイス
         self.device = None
         self.driver = None
-        
+
+        # ログキュー（ワーカースレッド → Tkメインスレッド）
+        self._log_queue = queue.Queue()
+        self._now = datetime.datetime.now  # 属性ルックアップ削減用の束縛参照
+
         self._create_widgets()
-        self._setup_device()
+
+        # デバイス初期化はバックグラウンドで実行し、初回描画をブロックしない
+        # （デバイス依存ボタンは初期化完了まで無効）
+        threading.Thread(target=self._setup_device, daemon=True).start()
+
+        # ログポンプを開始（20Hzでキューをまとめて描画）
+        self.root.after(50, self._drain_log)
     
     def _create_widgets(self):
         """ウィジェットを作成"""
@@ -53,30 +98,21 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=10)
         
-        # デバッグツールボタン
+        # デバッグツールボタン（デバイス初期化完了まで無効）
         debug_frame = ttk.LabelFrame(button_frame, text="デバッグツール", padding=10)
         debug_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Button(
-            debug_frame, 
-            text="デバッグUI", 
-            command=self._launch_debug_ui,
-            width=20
-        ).pack(side=tk.LEFT, padx=5)
-        
-        ttk.Button(
-            debug_frame, 
-            text="波形ビューア", 
-            command=self._launch_waveform_viewer,
-            width=20
-        ).pack(side=tk.LEFT, padx=5)
-        
-        ttk.Button(
-            debug_frame, 
-            text="エンベロープビューア", 
-            command=self._launch_envelope_viewer,
-            width=20
-        ).pack(side=tk.LEFT, padx=5)
+
+        self._device_buttons = []
+
+        for text, command in [
+            ("デバッグUI", self._launch_debug_ui),
+            ("波形ビューア", self._launch_waveform_viewer),
+            ("エンベロープビューア", self._launch_envelope_viewer),
+        ]:
+            button = ttk.Button(debug_frame, text=text, command=command,
+                                width=20, state='disabled')
+            button.pack(side=tk.LEFT, padx=5)
+            self._device_buttons.append(button)
         
         # サンプルボタン
         sample_frame = ttk.LabelFrame(button_frame, text="サンプル実行", padding=10)
@@ -107,7 +143,10 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
         info_frame = ttk.LabelFrame(button_frame, text="システム情報", padding=10)
         info_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.info_text = tk.Text(info_frame, height=8, width=70)
+        # wrap='none'/undo=Falseで挿入時の再レイアウトコストを抑え、
+        # 更新時以外はstate='disabled'で読み取り専用にする
+        self.info_text = tk.Text(info_frame, height=8, width=70,
+                                 wrap='none', undo=False, state='disabled')
         scrollbar = ttk.Scrollbar(info_frame, orient=tk.VERTICAL, command=self.info_text.yview)
         self.info_text.configure(yscrollcommand=scrollbar.set)
         
@@ -126,19 +165,33 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
         self._update_info()
     
     def _setup_device(self):
-        """デバイスをセットアップ"""
+        """デバイスをセットアップ（バックグラウンドスレッドで実行）
+
+        Tkウィジェットには直接触れず、完了通知はafter経由で
+        メインスレッドに渡します。
+        """
         try:
             from pypsgemu.core.ay38910 import create_ay38910_core
             from pypsgemu.core.device_config import create_default_config
-            
+
             config = create_default_config()
             self.device = create_ay38910_core(config)
-            
+
             self._log("デバイスが正常に初期化されました")
-            
+            self.root.after(0, self._on_device_ready)
+
         except Exception as e:
             self._log(f"デバイス初期化エラー: {e}")
-            messagebox.showerror("エラー", f"デバイスの初期化に失敗しました:\n{e}")
+            self.root.after(0, lambda e=e: messagebox.showerror(
+                "エラー", f"デバイスの初期化に失敗しました:\n{e}"))
+
+    def _on_device_ready(self):
+        """デバイス初期化完了処理（Tkメインスレッドで実行）"""
+        for button in self._device_buttons:
+            button.config(state='normal')
+
+        # デバイス設定を含めてシステム情報を更新
+        self._update_info()
     
     def _launch_debug_ui(self):
         """デバッグUIを起動"""
@@ -152,7 +205,6 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
             debug_ui = create_debug_ui(self.device, "AY-3-8910 Debug UI")
             
             # 新しいスレッドでUIを実行
-            import threading
             thread = threading.Thread(target=debug_ui.run, daemon=True)
             thread.start()
             
@@ -174,7 +226,6 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
             viewer = create_waveform_viewer(self.device)
             
             # 新しいスレッドでビューアを実行
-            import threading
             thread = threading.Thread(target=viewer.run, daemon=True)
             thread.start()
             
@@ -196,7 +247,6 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
             viewer = create_envelope_viewer(self.device)
             
             # 新しいスレッドでビューアを実行
-            import threading
             thread = threading.Thread(target=viewer.run, daemon=True)
             thread.start()
             
@@ -209,7 +259,6 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
     def _run_basic_example(self):
         """基本使用例を実行"""
         try:
-            import threading
             from examples.basic_usage import main
             
             def run_example():
@@ -231,7 +280,6 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
     def _run_audio_example(self):
         """音声出力例を実行"""
         try:
-            import threading
             from examples.audio_output import main
             
             def run_example():
@@ -253,7 +301,6 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
     def _run_register_example(self):
         """レジスタ制御例を実行"""
         try:
-            import threading
             from examples.register_control import main
             
             def run_example():
@@ -275,52 +322,52 @@ AY-3-8910 PSGチップの完全なソフトウェアエミュレータです。
     def _update_info(self):
         """システム情報を更新"""
         try:
-            import pypsgemu
-            import sys
-            import platform
-            
-            info_lines = [
-                f"PyPSGEmu Version: {getattr(pypsgemu, '__version__', '1.0.0')}",
-                f"Python Version: {sys.version}",
-                f"Platform: {platform.platform()}",
-                "",
-                "利用可能な機能:",
-                "- AY-3-8910 完全エミュレーション",
-                "- リアルタイム音声出力",
-                "- デバッグ・可視化ツール",
-                "- 状態管理・スナップショット",
-                "- 包括的なテストスイート",
-                "",
-                "使用方法:",
-                "1. 上記のボタンでツールやサンプルを起動",
-                "2. デバッグUIでリアルタイム制御",
-                "3. 各種ビューアで内部状態を可視化",
-            ]
-            
+            info_text = _get_static_info()
+
             if self.device:
                 config = self.device.get_config()
-                info_lines.extend([
-                    "",
-                    "デバイス設定:",
-                    f"- クロック周波数: {config.clock_frequency/1000000:.1f} MHz",
-                    f"- サンプルレート: {config.sample_rate} Hz",
-                    f"- 音量スケール: {config.volume_scale}",
-                ])
-            
+                info_text += (
+                    "\n\nデバイス設定:\n"
+                    f"- クロック周波数: {config.clock_frequency/1000000:.1f} MHz\n"
+                    f"- サンプルレート: {config.sample_rate} Hz\n"
+                    f"- 音量スケール: {config.volume_scale}"
+                )
+
+            self.info_text.configure(state='normal')
             self.info_text.delete(1.0, tk.END)
-            self.info_text.insert(1.0, "\n".join(info_lines))
+            self.info_text.insert(1.0, info_text)
+            self.info_text.configure(state='disabled')
             
         except Exception as e:
             self._log(f"情報更新エラー: {e}")
     
     def _log(self, message: str):
-        """ログメッセージを追加"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        
-        self.info_text.insert(tk.END, log_message)
-        self.info_text.see(tk.END)
+        """ログメッセージを追加（任意のスレッドから呼び出し可能）
+
+        Tkウィジェットには直接触れず、キューへの追加のみを行います。
+        描画は_drain_logがTkメインスレッドでまとめて実行します。
+        """
+        timestamp = self._now().strftime("%H:%M:%S")
+        self._log_queue.put_nowait(f"[{timestamp}] {message}\n")
+
+    def _drain_log(self):
+        """ログキューの内容をまとめて描画（Tkメインスレッドで実行）"""
+        lines = []
+        try:
+            while len(lines) < 100:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            # 1回のinsertに集約してレイアウト回数を抑える
+            self.info_text.configure(state='normal')
+            self.info_text.insert(tk.END, "".join(lines))
+            self.info_text.mark_set('insert', 'end')
+            self.info_text.configure(state='disabled')
+            self.info_text.see(tk.END)
+
+        self.root.after(50, self._drain_log)
     
     def _quit(self):
         """アプリケーションを終了"""
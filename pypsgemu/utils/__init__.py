@@ -10,9 +10,9 @@ from .volume_table import (
     VolumeTable,
     
     # ファクトリ関数
-    create_mame_volume_table,
-    create_linear_volume_table,
-    create_custom_volume_table,
+    create_ay_volume_table,
+    create_ym_volume_table,
+    create_volume_table_by_chip,
     create_exponential_volume_table,
 )
 
@@ -25,6 +25,9 @@ from .lfsr import (
     create_lfsr_with_seed,
     test_lfsr_period,
     generate_noise_sequence,
+    generate_noise_sequence_array,
+    generate_noise_sequence_list,
+    advance_lfsr_state,
 )
 
 # バージョン情報
@@ -36,9 +39,9 @@ __all__ = [
     "VolumeTable",
     
     # VolumeTable ファクトリ関数
-    "create_mame_volume_table",
-    "create_linear_volume_table", 
-    "create_custom_volume_table",
+    "create_ay_volume_table",
+    "create_ym_volume_table",
+    "create_volume_table_by_chip",
     "create_exponential_volume_table",
     
     # LFSRクラス
@@ -49,4 +52,7 @@ __all__ = [
     "create_lfsr_with_seed",
     "test_lfsr_period",
     "generate_noise_sequence",
+    "generate_noise_sequence_array",
+    "generate_noise_sequence_list",
+    "advance_lfsr_state",
 ]
@@ -6,8 +6,27 @@ AY-3-8910 PSG エミュレータ - 線形帰還シフトレジスタ (LFSR)
 フィードバック多項式: x^17 + x^14 + 1 (AYUMI準拠)
 """
 
+from functools import lru_cache
 from typing import Optional
+import numpy as np
 from ..core.types import InvalidValueError
+from .lfsr_numba import generate_noise_bits
+
+
+@lru_cache(maxsize=4096)
+def _bits17(value: int) -> str:
+    """17ビット値のビット文字列表現（キャッシュ付き）
+
+    デバッグUIのポーリングでは同じ値が繰り返し要求されるため、
+    format呼び出しを辞書参照に置き換えます。
+
+    Args:
+        value: 17ビット値
+
+    Returns:
+        17桁のビット文字列 (MSBが左端)
+    """
+    return format(value, '017b')
 
 
 class LFSR:
@@ -22,7 +41,10 @@ class LFSR:
         _initial_value: 初期値
         _cycle_count: 更新回数
     """
-    
+
+    # インスタンス辞書を持たず、スロット経由で属性アクセスを高速化
+    __slots__ = ('_value', '_initial_value', '_cycle_count', '_seen_step')
+
     # 17ビットLFSRの初期値（AYUMI準拠）
     # AYUMIでは初期値1を使用
     INITIAL_VALUE = 1  # AYUMI準拠の初期値
@@ -46,15 +68,14 @@ class LFSR:
         if initial_value is None:
             initial_value = self.INITIAL_VALUE
         
-        if not (0 <= initial_value <= self.MASK_17BIT):
-            raise InvalidValueError(f"LFSR initial value {initial_value} out of range [0, {self.MASK_17BIT}]")
-        
-        if initial_value == 0:
-            raise InvalidValueError("LFSR initial value cannot be 0 (would lock up)")
+        # 範囲チェックとゼロ禁止（ロックアップ防止）を単一比較に統合
+        if not 1 <= initial_value <= self.MASK_17BIT:
+            raise InvalidValueError(f"LFSR initial value {initial_value} out of range [1, {self.MASK_17BIT}]")
         
         self._initial_value = initial_value
         self._value = initial_value
         self._cycle_count = 0
+        self._seen_step = False
     
     def step(self) -> bool:
         """LFSRを1ステップ進める
@@ -80,19 +101,44 @@ class LFSR:
         
         # サイクルカウントを更新
         self._cycle_count += 1
+        self._seen_step = True
         
         # 新しいビット0を返す
         return bool(self._value & 1)
     
+    def step_int(self) -> int:
+        """LFSRを1ステップ進め、出力ビットをintで返す
+
+        step()と同一の状態遷移を行いますが、bool()ラップを省いた
+        生の0/1を返します。出力を数値として消費する内部呼び出し用です。
+
+        Returns:
+            更新後のビット0の値 (0または1)
+        """
+        value = self._value
+        feedback_bit = (value ^ (value >> 14)) & 1
+        self._value = ((value >> 1) | (feedback_bit << 16)) & self.MASK_17BIT
+        self._cycle_count += 1
+        self._seen_step = True
+        return self._value & 1
+
     def get_output(self) -> bool:
         """現在の出力ビット（ビット0）を取得
-        
+
         AY-3-8910の仕様では、ノイズ出力はLFSRのビット0を使用します。
-        
+
         Returns:
             現在のビット0の値
         """
         return bool(self._value & 1)
+
+    def get_output_int(self) -> int:
+        """現在の出力ビット（ビット0）を0/1のintで取得
+
+        Returns:
+            現在のビット0の値 (0または1)
+        """
+        return self._value & 1
     
     def get_value(self) -> int:
         """現在のLFSR値を取得
@@ -111,12 +157,10 @@ class LFSR:
         Raises:
             InvalidValueError: 値が無効な場合
         """
-        if not (0 <= value <= self.MASK_17BIT):
-            raise InvalidValueError(f"LFSR value {value} out of range [0, {self.MASK_17BIT}]")
-        
-        if value == 0:
-            raise InvalidValueError("LFSR value cannot be 0 (would lock up)")
-        
+        # 範囲チェックとゼロ禁止（ロックアップ防止）を単一比較に統合
+        if not 1 <= value <= self.MASK_17BIT:
+            raise InvalidValueError(f"LFSR value {value} out of range [1, {self.MASK_17BIT}]")
+
         self._value = value
     
     def reset(self, new_initial_value: Optional[int] = None) -> None:
@@ -126,12 +170,13 @@ class LFSR:
             new_initial_value: 新しい初期値 (Noneの場合は元の初期値を使用)
         """
         if new_initial_value is not None:
-            if not (0 < new_initial_value <= self.MASK_17BIT):
+            if not 1 <= new_initial_value <= self.MASK_17BIT:
                 raise InvalidValueError(f"LFSR initial value {new_initial_value} out of range [1, {self.MASK_17BIT}]")
             self._initial_value = new_initial_value
         
         self._value = self._initial_value
         self._cycle_count = 0
+        self._seen_step = False
     
     def get_cycle_count(self) -> int:
         """更新回数を取得
@@ -157,7 +202,7 @@ class LFSR:
         Returns:
             現在の値が初期値と同じ場合True
         """
-        return self._value == self._initial_value and self._cycle_count > 0
+        return self._seen_step and self._value == self._initial_value
     
     def get_bit(self, position: int) -> bool:
         """指定位置のビットを取得
@@ -171,10 +216,20 @@ class LFSR:
         Raises:
             InvalidValueError: 位置が無効な場合
         """
-        if not (0 <= position <= 16):
+        if not 0 <= position <= 16:
             raise InvalidValueError(f"Bit position {position} out of range [0, 16]")
-        
+
         return bool((self._value >> position) & 1)
+
+    def get_bit_int(self) -> int:
+        """出力ビット（ビット0）を0/1のintで取得（ホットパス用）
+
+        get_bit(0)と等価ですが、範囲チェックとbool()ラップを省きます。
+
+        Returns:
+            ビット0の値 (0または1)
+        """
+        return self._value & 1
     
     def get_bits_as_string(self) -> str:
         """LFSR値をビット文字列として取得
@@ -182,7 +237,7 @@ class LFSR:
         Returns:
             17ビットのビット文字列 (MSBが左端)
         """
-        return format(self._value, '017b')
+        return _bits17(self._value)
     
     def step_multiple(self, steps: int) -> bool:
         """複数ステップを一度に実行
@@ -198,42 +253,198 @@ class LFSR:
         """
         if steps < 0:
             raise InvalidValueError(f"Steps must be non-negative, got {steps}")
-        
-        output = self.get_output()
+
+        # 小さなステップ数の特殊化（ループ機構のコストを回避）
+        if steps == 0:
+            return bool(self._value & 1)
+
+        if steps == 1:
+            return self.step()
+
+        if steps >= 64:
+            # 大きなステップ数はGF(2)行列累乗で一括前進
+            self._value = advance_lfsr_state(self._value, steps)
+            self._cycle_count += steps
+            self._seen_step = True
+            return bool(self._value & 1)
+
+        output = False
         for _ in range(steps):
             output = self.step()
-        
+
         return output
     
+    def step_block(self, steps: int = 16) -> int:
+        """最大16ステップを一括実行し、出力ビットを詰めた整数を返す
+
+        フィードバックの線形性を利用したSWAR（ワード内ビット並列）演算で、
+        stepsステップ分のフィードバックビットをまとめて計算します。
+        1ステップずつのループと比べ、インタプリタの往復回数が1/stepsになります。
+
+        Args:
+            steps: 実行するステップ数 (1-16)
+
+        Returns:
+            出力ビットを詰めた整数（ビットj = j+1ステップ目の出力、最古がLSB）
+
+        Raises:
+            InvalidValueError: ステップ数が範囲外の場合
+        """
+        if not (1 <= steps <= 16):
+            raise InvalidValueError(f"Block steps must be in [1, 16], got {steps}")
+
+        value = self._value
+        mask = (1 << steps) - 1
+
+        # steps <= 16 の間、各ステップの出力は現在値のビット1..16そのもの
+        outputs = (value >> 1) & mask
+
+        # フィードバックビット列 f_1..f_16 を一括計算:
+        #   f_j = bit(j-1) XOR bit(j+13)  (j <= 3)
+        #   f_j = bit(j-1) XOR f_{j-3}    (j >= 4)
+        # 再帰 F = C ^ (F << 3) を展開して5回のXORで解く
+        c = value ^ (value >> 14)
+        f = c ^ (c << 3) ^ (c << 6) ^ (c << 9) ^ (c << 12) ^ (c << 15)
+
+        # 新しい状態: 右シフト + フィードバックを上位に挿入
+        self._value = ((value >> steps) | ((f & mask) << (17 - steps))) & self.MASK_17BIT
+        self._cycle_count += steps
+        self._seen_step = True
+
+        return outputs
+
     def predict_next_output(self) -> bool:
         """次のステップの出力を予測（状態は変更しない）
-        
+
+        右シフト構成のため、次のステップのビット0は現在のビット1です。
+        状態の保存・復元なしに直接計算します。
+
         Returns:
             次のステップでのビット0の値
         """
-        # 現在の状態を保存
-        saved_value = self._value
-        saved_count = self._cycle_count
-        
-        # 1ステップ実行して結果を取得
-        next_output = self.step()
-        
-        # 状態を復元
-        self._value = saved_value
-        self._cycle_count = saved_count
-        
-        return next_output
-    
+        return bool((self._value >> 1) & 1)
+
+    def output_at(self, index: int) -> bool:
+        """周期内の指定位置の出力ビットを取得
+
+        シード1からの全周期出力列をキャッシュし、インデックス参照で
+        返します。ステップ演算は行いません。
+
+        Args:
+            index: 周期内位置（周期長131071で折り返し）
+
+        Returns:
+            指定位置の出力ビット
+        """
+        return bool(_get_period_bits()[index % _PERIOD_LENGTH])
+
+    def fill_output_window(self, start: int, n: int, out: 'np.ndarray') -> None:
+        """キャッシュ済み周期ビット列から出力窓をバッファへ書き込む
+
+        周期境界をまたぐ場合はスライスコピーを分割して処理します。
+
+        Args:
+            start: 周期内の開始位置
+            n: 書き込むビット数
+            out: 書き込み先バッファ（n要素以上）
+
+        Raises:
+            InvalidValueError: ビット数が負、またはバッファが小さい場合
+        """
+        if n < 0:
+            raise InvalidValueError(f"Window length must be non-negative, got {n}")
+
+        if len(out) < n:
+            raise InvalidValueError(f"Output buffer too small: {len(out)} < {n}")
+
+        bits = _get_period_bits()
+        pos = start % _PERIOD_LENGTH
+        filled = 0
+        while filled < n:
+            chunk = min(n - filled, _PERIOD_LENGTH - pos)
+            out[filled:filled + chunk] = bits[pos:pos + chunk]
+            filled += chunk
+            pos = 0
+
+    def fill_noise(self, out: 'np.ndarray', n: Optional[int] = None) -> None:
+        """ノイズサンプルを±1.0のfloat値として一括生成
+
+        キャッシュ済みの周期ビット列から現在状態以降のnビットを
+        スライスコピーで取り出し、0/1を-1.0/+1.0に変換して書き込みます。
+        ミキサのホットループでstep()をサンプルごとに呼ぶ代わりに
+        使用してください。状態はnステップ分進みます。
+
+        Args:
+            out: 書き込み先のfloatバッファ（n要素以上）
+            n: 生成するサンプル数（Noneの場合はoutの全長）
+
+        Raises:
+            InvalidValueError: サンプル数が負、またはバッファが小さい場合
+        """
+        if n is None:
+            n = len(out)
+
+        if n < 0:
+            raise InvalidValueError(f"Sample count must be non-negative, got {n}")
+
+        if len(out) < n:
+            raise InvalidValueError(f"Output buffer too small: {len(out)} < {n}")
+
+        if n == 0:
+            return
+
+        bits = _get_period_bits()
+        pos = int(_get_state_index()[self._value])
+        filled = 0
+        while filled < n:
+            chunk = min(n - filled, _PERIOD_LENGTH - pos)
+            # 0/1 → -1.0/+1.0 （ベクトル演算で直接書き込み）
+            np.multiply(bits[pos:pos + chunk], 2.0, out=out[filled:filled + chunk])
+            pos = (pos + chunk) % _PERIOD_LENGTH
+            filled += chunk
+        out[:n] -= 1.0
+
+        # 状態をnステップ分前進
+        self._value = advance_lfsr_state(self._value, n % _PERIOD_LENGTH)
+        self._cycle_count += n
+        self._seen_step = True
+
     def copy(self) -> 'LFSR':
         """LFSRの深いコピーを作成
-        
+
         Returns:
             現在の状態をコピーした新しいLFSRインスタンス
         """
-        new_lfsr = LFSR(self._initial_value)
+        return self.__copy__()
+
+    def __copy__(self) -> 'LFSR':
+        """copy.copy()用の高速コピー
+
+        状態は検証済みなので、__init__の範囲チェックを迂回して
+        __new__でインスタンスを生成し、スロットを直接転写します。
+
+        Returns:
+            現在の状態をコピーした新しいLFSRインスタンス
+        """
+        new_lfsr = LFSR.__new__(LFSR)
         new_lfsr._value = self._value
+        new_lfsr._initial_value = self._initial_value
         new_lfsr._cycle_count = self._cycle_count
+        new_lfsr._seen_step = self._seen_step
         return new_lfsr
+
+    def __deepcopy__(self, memo) -> 'LFSR':
+        """copy.deepcopy()用の高速コピー
+
+        全スロットがイミュータブルな値型のため、浅いコピーと同一です。
+
+        Args:
+            memo: deepcopyのメモ辞書
+
+        Returns:
+            現在の状態をコピーした新しいLFSRインスタンス
+        """
+        return self.__copy__()
     
     def __str__(self) -> str:
         """文字列表現"""
@@ -254,6 +465,163 @@ class LFSR:
                 self._initial_value == other._initial_value)
 
 
+# =============================================================================
+# 全周期ノイズビットキャッシュ
+# =============================================================================
+
+# 17ビットLFSRの周期長 (2^17 - 1)
+_PERIOD_LENGTH = (1 << 17) - 1
+
+# シード1（AYUMI準拠）からの全周期出力ビット列（遅延生成、約128KB）
+_PERIOD_BITS: Optional[np.ndarray] = None
+
+
+def _get_period_bits() -> np.ndarray:
+    """全周期ノイズビット列を取得（初回アクセス時に生成）
+
+    LFSRは非ゼロの全状態を巡回するため、シード1からの1周期分で
+    任意の状態からの出力列をカバーできます。
+
+    Returns:
+        131071要素のuint8配列（ビットi = i+1ステップ目の出力）
+    """
+    global _PERIOD_BITS
+    if _PERIOD_BITS is None:
+        _PERIOD_BITS = generate_noise_bits(LFSR.INITIAL_VALUE, _PERIOD_LENGTH)
+    return _PERIOD_BITS
+
+
+# 状態値 → 周期内位置の逆引きテーブル（遅延生成、512KB）
+_STATE_INDEX: Optional[np.ndarray] = None
+
+
+def _get_state_index() -> np.ndarray:
+    """状態値から周期内位置を引くテーブルを取得（初回アクセス時に生成）
+
+    Returns:
+        2^17要素のint32配列（table[状態値] = シード1からのステップ数）
+    """
+    global _STATE_INDEX
+    if _STATE_INDEX is None:
+        table = np.zeros(1 << 17, dtype=np.int32)
+        value = LFSR.INITIAL_VALUE
+        for i in range(_PERIOD_LENGTH):
+            table[value] = i
+            feedback_bit = (value ^ (value >> 14)) & 1
+            value = ((value >> 1) | (feedback_bit << 16)) & 0x1FFFF
+        _STATE_INDEX = table
+    return _STATE_INDEX
+
+
+# =============================================================================
+# GF(2)行列によるkステップ一括前進
+# =============================================================================
+
+# 1ステップの状態遷移行列（17行、各行は17ビットマスク）
+# 新しいビットi = parity(row[i] & 現在値)
+#   - i < 16: 右シフトなので row[i] = bit(i+1)
+#   - i = 16: フィードバック bit0 XOR bit14
+_STEP_MATRIX = tuple([1 << (i + 1) for i in range(16)] + [(1 << 0) | (1 << 14)])
+
+# 2^n ステップ分の遷移行列キャッシュ（繰り返し二乗法で構築）
+_STEP_MATRIX_POWERS = {0: _STEP_MATRIX}
+
+
+def _matrix_multiply(a: list, b: list) -> list:
+    """GF(2)上の行列積を計算
+
+    各行は17ビットマスクとして表現されます。
+    (a・b) の行iは、aの行iで立っているビットに対応するbの行のXORです。
+
+    Args:
+        a: 左側の行列（17個のビットマスク）
+        b: 右側の行列（17個のビットマスク）
+
+    Returns:
+        積行列（17個のビットマスク）
+    """
+    result = []
+    for row in a:
+        acc = 0
+        j = 0
+        while row:
+            if row & 1:
+                acc ^= b[j]
+            row >>= 1
+            j += 1
+        result.append(acc)
+    return result
+
+
+def _step_matrix_power(steps: int) -> list:
+    """stepsステップ分の遷移行列を取得
+
+    繰り返し二乗法で2^nステップ行列をキャッシュし、
+    stepsの2進表現に従って合成します。
+
+    Args:
+        steps: ステップ数（非負）
+
+    Returns:
+        stepsステップ分の遷移行列
+    """
+    result = None
+    bit = 0
+    while steps:
+        if steps & 1:
+            if bit not in _STEP_MATRIX_POWERS:
+                # 未構築の2^bit行列を順次生成
+                max_bit = max(_STEP_MATRIX_POWERS)
+                prev = _STEP_MATRIX_POWERS[max_bit]
+                for n in range(max_bit + 1, bit + 1):
+                    prev = _matrix_multiply(prev, prev)
+                    _STEP_MATRIX_POWERS[n] = prev
+            power = _STEP_MATRIX_POWERS[bit]
+            result = power if result is None else _matrix_multiply(power, result)
+        steps >>= 1
+        bit += 1
+
+    if result is None:
+        # 0ステップ: 単位行列
+        result = [1 << i for i in range(17)]
+
+    return result
+
+
+def advance_lfsr_state(value: int, steps: int) -> int:
+    """LFSR値をstepsステップ進めた値を直接計算
+
+    LFSRの線形性を利用し、GF(2)上の遷移行列の累乗を
+    状態ベクトルに適用します。計算量はO(log steps)の行列合成のみで、
+    1ステップずつのループを行いません。
+
+    Args:
+        value: 現在の17ビットLFSR値
+        steps: 進めるステップ数（非負）
+
+    Returns:
+        stepsステップ後のLFSR値
+
+    Raises:
+        InvalidValueError: ステップ数が負、または値が範囲外の場合
+    """
+    if steps < 0:
+        raise InvalidValueError(f"Steps must be non-negative, got {steps}")
+
+    if not 1 <= value <= LFSR.MASK_17BIT:
+        raise InvalidValueError(f"LFSR value {value} out of range [1, {LFSR.MASK_17BIT}]")
+
+    matrix = _step_matrix_power(steps)
+
+    result = 0
+    for i, row in enumerate(matrix):
+        # parity(row & value) が新しいビットi
+        if bin(row & value).count('1') & 1:
+            result |= 1 << i
+
+    return result
+
+
 # =============================================================================
 # ユーティリティ関数
 # =============================================================================
@@ -293,31 +661,114 @@ def test_lfsr_period(lfsr: LFSR, max_steps: int = 200000) -> int:
         この関数はテスト・デバッグ用途のみに使用してください。
         実際の周期測定には時間がかかる場合があります。
     """
-    initial_value = lfsr.get_value()
-    lfsr.reset()
-    
+    # 対象のLFSRは変更せず、ローカル整数で同じ漸化式を回す
+    # （メソッドディスパッチなしのタイトループ）
+    start = lfsr.get_value()
+    value = start
+
     for step in range(1, max_steps + 1):
-        lfsr.step()
-        if lfsr.get_value() == initial_value:
+        value = ((value >> 1) | (((value ^ (value >> 14)) & 1) << 16)) & 0x1FFFF
+        if value == start:
             return step
-    
+
     return -1  # 周期が見つからなかった
 
 
-def generate_noise_sequence(length: int, seed: Optional[int] = None) -> list[bool]:
+def run_bench(samples: int = 1000000, seed: Optional[int] = None) -> dict:
+    """LFSR生成経路のスループットを測定
+
+    1ステップずつのstep()呼び出しと、バッチカーネル
+    （Numba利用可能時はネイティブコード）による一括生成を比較します。
+    ミキサ統合方式の選定やカーネル変更時の回帰確認に使用してください。
+
+    Args:
+        samples: 測定に使用するサンプル数
+        seed: LFSRのシード値 (Noneの場合はデフォルト値を使用)
+
+    Returns:
+        測定結果辞書（経路ごとの所要時間と samples/sec）
+    """
+    import time
+    from .lfsr_numba import NUMBA_AVAILABLE
+
+    if seed is None:
+        seed = LFSR.INITIAL_VALUE
+
+    # 1ステップずつ（測定コスト抑制のためサンプル数を制限）
+    step_samples = min(samples, 100000)
+    lfsr = LFSR(seed)
+    start = time.perf_counter()
+    for _ in range(step_samples):
+        lfsr.step()
+    step_elapsed = time.perf_counter() - start
+
+    # バッチカーネル
+    start = time.perf_counter()
+    generate_noise_bits(seed, samples)
+    batch_elapsed = time.perf_counter() - start
+
+    return {
+        'numba_available': NUMBA_AVAILABLE,
+        'step_samples': step_samples,
+        'step_elapsed_sec': step_elapsed,
+        'step_samples_per_sec': step_samples / step_elapsed if step_elapsed > 0 else 0.0,
+        'batch_samples': samples,
+        'batch_elapsed_sec': batch_elapsed,
+        'batch_samples_per_sec': samples / batch_elapsed if batch_elapsed > 0 else 0.0,
+    }
+
+
+def generate_noise_sequence(length: int, seed: Optional[int] = None) -> 'np.ndarray':
     """ノイズシーケンスを生成
-    
+
+    uint8配列を返します（要素あたり1バイト、リスト比で約1/8のメモリ）。
+    Pythonのリストが必要な場合はgenerate_noise_sequence_listを
+    使用してください。
+
     Args:
         length: 生成するシーケンスの長さ
         seed: LFSRのシード値
-        
+
+    Returns:
+        ノイズビットのuint8配列 (0/1)
+    """
+    return generate_noise_sequence_array(length, seed)
+
+
+def generate_noise_sequence_list(length: int, seed: Optional[int] = None) -> list[bool]:
+    """ノイズシーケンスをPythonリストとして生成（後方互換ラッパ）
+
+    Args:
+        length: 生成するシーケンスの長さ
+        seed: LFSRのシード値
+
     Returns:
         ノイズビットのリスト
     """
-    lfsr = LFSR(seed) if seed is not None else create_default_lfsr()
-    sequence = []
-    
-    for _ in range(length):
-        sequence.append(lfsr.step())
-    
-    return sequence
+    return (generate_noise_sequence_array(length, seed) != 0).tolist()
+
+
+def generate_noise_sequence_array(length: int, seed: Optional[int] = None) -> 'np.ndarray':
+    """ノイズシーケンスをNumPy配列として生成
+
+    バッチカーネル（Numba利用可能時はネイティブコード）で一括生成するため、
+    LFSR.step()を1ビットずつ呼ぶよりも大幅に高速です。
+    ノイズミキシングをNumPy側に留めたい場合はこちらを使用してください。
+
+    Args:
+        length: 生成するシーケンスの長さ
+        seed: LFSRのシード値 (Noneの場合はデフォルト値を使用)
+
+    Returns:
+        ノイズビットのuint8配列 (0/1)
+
+    Raises:
+        InvalidValueError: シード値が無効な場合
+    """
+    if seed is None:
+        seed = LFSR.INITIAL_VALUE
+
+    if not 1 <= seed <= LFSR.MASK_17BIT:
+        raise InvalidValueError(f"LFSR seed {seed} out of range [1, {LFSR.MASK_17BIT}]")
+
+    return generate_noise_bits(seed, length)
@@ -0,0 +1,93 @@
+"""
+AY-3-8910 PSG エミュレータ - LFSRバッチ生成カーネル
+
+このモジュールは、17ビットLFSRのノイズビット列を一括生成する
+カーネルを提供します。Numbaが利用可能な場合はネイティブコードに
+JITコンパイルされ、利用できない環境では純Pythonループに
+フォールバックします。
+
+フィードバック多項式: x^17 + x^14 + 1 (AYUMI準拠、utils.lfsr.LFSRと同一)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+def _gen_noise_kernel(seed, length):
+    """LFSRノイズビット列を生成するカーネル本体
+
+    Args:
+        seed: 17ビットLFSR初期値
+        length: 生成するビット数
+
+    Returns:
+        各ステップ後のビット0を格納したuint8配列
+    """
+    out = np.empty(length, dtype=np.uint8)
+    value = seed
+    for i in range(length):
+        feedback_bit = (value ^ (value >> 14)) & 1
+        value = ((value >> 1) | (feedback_bit << 16)) & 0x1FFFF
+        out[i] = value & 1
+    return out
+
+
+def _gen_noise_swar(seed, length):
+    """SWARワード単位でノイズビット列を生成（純Pythonフォールバック）
+
+    フィードバックの線形性を利用し、1イテレーションで16ステップ分の
+    出力ビットをuint16ワードに詰めて生成します。インタプリタの
+    ループ回数が1/16になり、ビット展開はnp.unpackbitsが行います。
+
+    Args:
+        seed: 17ビットLFSR初期値
+        length: 生成するビット数
+
+    Returns:
+        各ステップ後のビット0を格納したuint8配列
+    """
+    n_words = (length + 15) // 16
+    words = np.empty(n_words, dtype='<u2')
+    value = seed
+    for w in range(n_words):
+        # 16ステップ分の出力は現在値のビット1..16そのもの
+        words[w] = (value >> 1) & 0xFFFF
+
+        # フィードバックビット列 F = C ^ (F << 3) を展開して一括計算
+        c = value ^ (value >> 14)
+        f = c ^ (c << 3) ^ (c << 6) ^ (c << 9) ^ (c << 12) ^ (c << 15)
+        value = (value >> 16) | ((f & 0xFFFF) << 1)
+
+    bits = np.unpackbits(words.view(np.uint8), bitorder='little')
+    return bits[:length]
+
+
+if NUMBA_AVAILABLE:
+    _gen_noise = njit(cache=True)(_gen_noise_kernel)
+else:
+    _gen_noise = _gen_noise_swar
+
+
+def generate_noise_bits(seed: int, length: int) -> np.ndarray:
+    """LFSRノイズビット列を一括生成
+
+    utils.lfsr.LFSR.step()をlength回呼んだ場合と同じビット列を
+    NumPy配列として返します。
+
+    Args:
+        seed: 17ビットLFSR初期値 (1-131071)
+        length: 生成するビット数（非負）
+
+    Returns:
+        ノイズビットのuint8配列 (0/1)
+    """
+    if length <= 0:
+        return np.empty(0, dtype=np.uint8)
+
+    return _gen_noise(seed, length)
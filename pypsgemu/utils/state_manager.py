@@ -5,27 +5,277 @@ AY-3-8910エミュレータの状態保存・復元機能を提供します。
 レジスタ状態の保存・読込、「パッチ」管理機能を実装しています。
 """
 
+import base64
+import hashlib
 import json
+import mmap
 import os
+import queue
+import threading
+import types
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 from ..core.types import AY38910Error, AY38910State
 from ..api.device import Device
 
+# orjson: C実装のJSONシリアライザ（利用可能な場合はjsonより高速）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# msgpack: オプトインのバイナリフォーマット
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+# zstandard: アーカイブ保存用の圧縮（*.zst）
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstd = None
+
+
+# zstdフレームのマジックナンバー（読み込み時の判別用）
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _compress_payload(payload: bytes) -> bytes:
+    """ペイロードをzstdで圧縮
+
+    Args:
+        payload: 圧縮するバイト列
+
+    Returns:
+        圧縮されたバイト列
+
+    Raises:
+        StateManagerError: zstandardがインストールされていない場合
+    """
+    if not ZSTD_AVAILABLE:
+        raise StateManagerError("zstd compression requested but zstandard is not installed")
+    return zstd.ZstdCompressor(level=3).compress(payload)
+
 
 class StateManagerError(AY38910Error):
     """状態管理関連のエラー"""
     pass
 
 
+def _serialize_state_file(data: Dict[str, Any], format: str) -> bytes:
+    """状態ファイルのエンベロープをバイト列にシリアライズ
+
+    デフォルトのJSONパスはorjsonが利用可能な場合にC実装を使用し、
+    'msgpack'指定でバイナリフォーマットを選択できます。
+
+    Args:
+        data: シリアライズする辞書
+        format: 'json' または 'msgpack'
+
+    Returns:
+        シリアライズされたバイト列
+
+    Raises:
+        StateManagerError: フォーマットが無効または利用できない場合
+    """
+    if format == 'msgpack':
+        if not MSGPACK_AVAILABLE:
+            raise StateManagerError("msgpack format requested but msgpack is not installed")
+        return msgpack.packb(data, use_bin_type=True)
+
+    if format != 'json':
+        raise StateManagerError(f"Unknown state file format: {format}")
+
+    if ORJSON_AVAILABLE:
+        # 非文字列キー（パッチのレジスタアドレス）はstdlib jsonと同様に文字列化
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _atomic_write_bytes(filepath: Path, data: bytes) -> None:
+    """バイト列を一時ファイル経由でアトミックに書き込み
+
+    書き込み途中のクラッシュで壊れた/空のファイルが残らないよう、
+    同ディレクトリの*.tmpファイルに書き込んでfsync後、
+    os.replaceで最終パスに原子的に置き換えます。
+
+    Args:
+        filepath: 最終的なファイルパス
+        data: 書き込むバイト列
+    """
+    tmp = filepath.with_suffix(filepath.suffix + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+    except Exception:
+        # 失敗時は一時ファイルを残さない
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _deserialize_state_file(raw: bytes, filepath: Path) -> Dict[str, Any]:
+    """状態ファイルのバイト列をデシリアライズ
+
+    先頭バイトでフォーマットを判別します（0x7B = '{' はJSON、それ以外はmsgpack）。
+
+    Args:
+        raw: ファイルから読み込んだバイト列（mmap等のバイト様オブジェクト可）
+        filepath: エラーメッセージ用のファイルパス
+
+    Returns:
+        デシリアライズされた辞書
+
+    Raises:
+        StateManagerError: パースに失敗した場合
+    """
+    if raw[:1] == b'{':
+        try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(raw)
+            # stdlib jsonはmemoryviewを受け付けないためbytesに変換
+            return json.loads(bytes(raw))
+        except ValueError as e:
+            raise StateManagerError(f"Invalid JSON in file '{filepath}': {e}")
+
+    if not MSGPACK_AVAILABLE:
+        raise StateManagerError(f"File '{filepath}' looks like msgpack but msgpack is not installed")
+
+    try:
+        return msgpack.unpackb(raw, raw=False)
+    except Exception as e:
+        raise StateManagerError(f"Invalid msgpack in file '{filepath}': {e}")
+
+
+def _freeze_state(state: Dict[str, Any]) -> 'types.MappingProxyType':
+    """状態辞書を読み取り専用ビューに凍結
+
+    呼び出し側による事後変更からスナップショットを守るため、
+    レジスタ配列をbytes（バイト範囲外ならtuple）に凍結した上で
+    MappingProxyTypeでラップします。辞書のコピーは1回だけです。
+
+    Args:
+        state: 凍結する状態辞書
+
+    Returns:
+        読み取り専用のマッピングビュー
+    """
+    inner = dict(state)
+    regs = inner.get('registers')
+    if regs is not None and not isinstance(regs, (bytes, tuple)):
+        try:
+            inner['registers'] = bytes(bytearray(regs))
+        except (ValueError, TypeError):
+            inner['registers'] = tuple(regs)
+    return types.MappingProxyType(inner)
+
+
+def _thaw_registers(state: Dict[str, Any]) -> Dict[str, Any]:
+    """凍結されたレジスタ配列を可変リストに戻す
+
+    デバイスのset_stateはレジスタを可変リストとして扱うため、
+    復元直前にbytes/tuple形式をリストへ展開します。
+
+    Args:
+        state: 状態辞書（破壊しない）
+
+    Returns:
+        レジスタをリスト化した状態辞書
+    """
+    regs = state.get('registers')
+    if isinstance(regs, (bytes, tuple)):
+        state = dict(state)
+        state['registers'] = list(regs)
+    return state
+
+
+def _read_envelope(filepath: Path) -> Dict[str, Any]:
+    """状態ファイルをメモリマップ経由で読み込んでデシリアライズ
+
+    ファイル全体をPython側のバッファへコピーせず、カーネルの
+    ページキャッシュに載ったマップ領域を直接パーサに渡します。
+
+    Args:
+        filepath: 読み込むファイルパス
+
+    Returns:
+        デシリアライズされたエンベロープ辞書
+
+    Raises:
+        StateManagerError: パースに失敗した場合
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # 空ファイルやmmap不可のファイルシステムでは通常読みに落とす
+            return _deserialize_state_file(f.read(), filepath)
+
+        # orjsonはmmapを直接受け付けないため、ゼロコピーのmemoryviewで渡す
+        view = memoryview(mm)
+        try:
+            # zstd圧縮ファイルはマジックナンバーで判別して透過展開
+            if view[:4] == _ZSTD_MAGIC:
+                if not ZSTD_AVAILABLE:
+                    raise StateManagerError(
+                        f"File '{filepath}' is zstd-compressed but zstandard is not installed")
+                raw = zstd.ZstdDecompressor().decompress(bytes(view))
+                return _deserialize_state_file(raw, filepath)
+            return _deserialize_state_file(view, filepath)
+        finally:
+            view.release()
+            mm.close()
+
+
+def _state_digest(state: Dict[str, Any]) -> Optional[bytes]:
+    """状態辞書の内容ハッシュ（コンテンツアドレス）を計算
+
+    キー順に正規化したシリアライズ結果のSHA-256を返します。
+    シリアライズできない状態ではNoneを返し、重複排除をスキップします。
+
+    Args:
+        state: ハッシュする状態辞書
+
+    Returns:
+        32バイトのダイジェスト、計算不能ならNone
+    """
+    try:
+        if ORJSON_AVAILABLE:
+            raw = orjson.dumps(dict(state),
+                               option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(dict(state), sort_keys=True, default=str).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(raw).digest()
+
+
 class StateSnapshot:
     """状態スナップショット
     
     AY-3-8910の特定時点での状態を保存するクラス。
     レジスタ値、内部状態、メタデータを含みます。
     """
-    
+
+    # スナップショット多量生成時のインスタンス辞書コストを削減
+    __slots__ = ('name', 'state', 'metadata')
+
     def __init__(self, name: str, state: Dict[str, Any], metadata: Dict[str, Any] = None):
         """StateSnapshotを初期化
         
@@ -35,29 +285,48 @@ class StateSnapshot:
             metadata: メタデータ（作成日時、説明など）
         """
         self.name = name
-        self.state = state.copy()
+        self.state = _freeze_state(state)
         self.metadata = metadata or {}
-        
-        # 自動メタデータ
-        if 'created_at' not in self.metadata:
-            self.metadata['created_at'] = datetime.now().isoformat()
-        if 'version' not in self.metadata:
-            self.metadata['version'] = '1.0'
     
     def to_dict(self) -> Dict[str, Any]:
-        """辞書形式にシリアライズ"""
+        """辞書形式にシリアライズ
+
+        レジスタ配列はint列のままではJSONトークンのオーバーヘッドが
+        大きいため、バイト列にパックしてbase64で格納します。
+        """
+        # 自動メタデータ（生成コストが高いため保存時まで遅延）
+        self.metadata.setdefault('created_at', datetime.now().isoformat())
+        self.metadata.setdefault('version', '1.0')
+
+        state = dict(self.state)
+        regs = state.get('registers')
+        if isinstance(regs, (list, tuple, bytearray, bytes)) and len(regs) <= 256:
+            try:
+                packed = base64.b64encode(bytes(bytearray(regs))).decode('ascii')
+            except (ValueError, TypeError):
+                # 0-255範囲外やint以外の要素はそのままリストで出力
+                packed = None
+            if packed is not None:
+                del state['registers']
+                state['registers_b64'] = packed
+
         return {
             'name': self.name,
-            'state': self.state,
+            'state': state,
             'metadata': self.metadata
         }
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StateSnapshot':
         """辞書からデシリアライズ"""
+        state = data['state']
+        if 'registers_b64' in state:
+            state = dict(state)
+            state['registers'] = list(base64.b64decode(state.pop('registers_b64')))
+
         return cls(
             name=data['name'],
-            state=data['state'],
+            state=state,
             metadata=data.get('metadata', {})
         )
 
@@ -68,7 +337,10 @@ class StatePatch:
     状態の差分を表現するクラス。
     特定のレジスタのみの変更を効率的に管理します。
     """
-    
+
+    __slots__ = ('name', 'register_changes', 'description', '_created_at',
+                 '_mask', '_values', '_indices')
+
     def __init__(self, name: str, register_changes: Dict[int, int], description: str = ""):
         """StatePatchを初期化
         
@@ -76,11 +348,46 @@ class StatePatch:
             name: パッチ名
             register_changes: レジスタ変更辞書 {address: value}
             description: パッチの説明
+
+        Note:
+            register_changes属性は読み取り専用ビューとして公開されます。
+            変更が必要な場合は呼び出し側でdict()コピーしてください。
         """
         self.name = name
-        self.register_changes = register_changes.copy()
+        self.register_changes = types.MappingProxyType(dict(register_changes))
         self.description = description
-        self.created_at = datetime.now().isoformat()
+        self._created_at: Optional[str] = None
+
+        # ビットマップ表現（アドレスマスク + 16バイト値列）を構築時に一度だけ作成
+        # バイト範囲外の値やstrキーの辞書では従来のループ適用に落とす
+        try:
+            mask = 0
+            values = bytearray(16)
+            for address, value in self.register_changes.items():
+                if not (0 <= address <= 15 and 0 <= value <= 255):
+                    raise ValueError
+                mask |= 1 << address
+                values[address] = value
+            self._mask = mask
+            self._values = bytes(values)
+            self._indices = np.nonzero(
+                np.unpackbits(np.array([mask], dtype='<u2').view(np.uint8),
+                              bitorder='little')[:16])[0]
+        except (ValueError, TypeError):
+            self._mask = 0
+            self._values = b''
+            self._indices = None
+    
+    @property
+    def created_at(self) -> str:
+        """作成日時（ISO形式、初回アクセス時に遅延生成）"""
+        if self._created_at is None:
+            self._created_at = datetime.now().isoformat()
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: str) -> None:
+        self._created_at = value
     
     def apply_to_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """状態にパッチを適用
@@ -91,23 +398,45 @@ class StatePatch:
         Returns:
             パッチ適用後の状態
         """
-        new_state = state.copy()
-        
-        # レジスタ変更を適用
-        if 'registers' in new_state:
+        new_state = dict(state)
+
+        # 凍結bytes形式はビットマップでO(1)一括適用
+        regs_frozen = new_state.get('registers')
+        if self._mask and isinstance(regs_frozen, bytes) and len(regs_frozen) >= 16:
+            regs = np.frombuffer(regs_frozen, dtype=np.uint8).copy()
+            regs[self._indices] = np.frombuffer(self._values, dtype=np.uint8)[self._indices]
+            new_state['registers'] = regs.tobytes()
+            return new_state
+
+        # レジスタ変更を適用（凍結形式・base64パック形式にも対応）
+        if isinstance(new_state.get('registers'), (bytes, tuple)):
+            registers = bytearray(new_state['registers']) \
+                if isinstance(new_state['registers'], bytes) else list(new_state['registers'])
+            for address, value in self.register_changes.items():
+                if 0 <= address <= 15:
+                    registers[address] = value
+            new_state['registers'] = bytes(registers) \
+                if isinstance(registers, bytearray) else tuple(registers)
+        elif 'registers_b64' in new_state:
+            registers = bytearray(base64.b64decode(new_state['registers_b64']))
+            for address, value in self.register_changes.items():
+                if 0 <= address <= 15:
+                    registers[address] = value
+            new_state['registers_b64'] = base64.b64encode(bytes(registers)).decode('ascii')
+        elif 'registers' in new_state:
             registers = new_state['registers'].copy()
             for address, value in self.register_changes.items():
                 if 0 <= address <= 15:
                     registers[address] = value
             new_state['registers'] = registers
-        
+
         return new_state
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式にシリアライズ"""
         return {
             'name': self.name,
-            'register_changes': self.register_changes,
+            'register_changes': dict(self.register_changes),
             'description': self.description,
             'created_at': self.created_at
         }
@@ -124,26 +453,61 @@ class StatePatch:
         return patch
 
 
+class _OnDisk:
+    """ディスクに退避されたスナップショットのセンチネル
+
+    LRUキャッシュから追い出されたスナップショットの置き場所と、
+    一覧表示用の軽量メタデータを保持します。
+    """
+
+    __slots__ = ('filepath', 'metadata')
+
+    def __init__(self, filepath: Path, metadata: Dict[str, Any]):
+        self.filepath = filepath
+        self.metadata = metadata
+
+
 class StateManager:
     """状態管理マネージャー
-    
+
     AY-3-8910エミュレータの状態スナップショット機能を提供します。
     状態の保存・復元、パッチ管理、ファイルI/O処理を行います。
     """
-    
-    def __init__(self, base_directory: str = "states"):
+
+    def __init__(self, base_directory: str = "states",
+                 max_in_memory_snapshots: Optional[int] = None,
+                 async_writes: bool = False):
         """StateManagerを初期化
-        
+
         Args:
             base_directory: 状態ファイルの保存ディレクトリ
+            max_in_memory_snapshots: メモリに保持するスナップショット数の上限
+                (Noneで無制限)。超過分はLRU順にディスクへ退避され、
+                アクセス時に再ロードされます。
+            async_writes: Trueの場合、save_*_to_fileのディスク書き込みを
+                バックグラウンドの書き込みスレッドに委譲します。呼び出し側は
+                シリアライズとキュー投入のみをブロックします。
         """
         self.base_directory = Path(base_directory)
         self.base_directory.mkdir(exist_ok=True)
-        
-        # 内部管理
-        self._snapshots: Dict[str, StateSnapshot] = {}
+        self.max_in_memory_snapshots = max_in_memory_snapshots
+        self.async_writes = async_writes
+
+        # バックグラウンド書き込み（初回使用時にスレッド起動）
+        self._write_queue: Optional['queue.Queue'] = None
+        self._writer: Optional[threading.Thread] = None
+
+        # 内部管理（挿入/アクセス順を保持するLRU）
+        self._snapshots: 'OrderedDict[str, Union[StateSnapshot, _OnDisk]]' = OrderedDict()
+        # 一覧表示用の作成順インデックス（_snapshotsはLRU順に並び替わるため別管理）
+        self._snapshot_order: 'OrderedDict[str, None]' = OrderedDict()
         self._patches: Dict[str, StatePatch] = {}
         self._current_snapshot: Optional[str] = None
+
+        # コンテンツアドレスによる重複排除（ハッシュ→名前、名前→ハッシュ、参照数）
+        self._by_hash: Dict[bytes, str] = {}
+        self._snapshot_hashes: Dict[str, bytes] = {}
+        self._hash_refs: Dict[bytes, int] = {}
         
         # 統計情報
         self._stats = {
@@ -151,9 +515,173 @@ class StateManager:
             'snapshots_loaded': 0,
             'patches_applied': 0,
             'files_saved': 0,
-            'files_loaded': 0
+            'files_loaded': 0,
+            'async_write_errors': 0
         }
     
+    def _write_file(self, filepath: Path, payload: bytes) -> None:
+        """ファイル書き込み（async_writesに応じて同期/非同期）
+
+        Args:
+            filepath: 書き込み先パス
+            payload: 書き込むバイト列
+        """
+        if not self.async_writes:
+            _atomic_write_bytes(filepath, payload)
+            return
+
+        if self._writer is None:
+            self._write_queue = queue.Queue(maxsize=128)
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+
+        self._write_queue.put((filepath, payload))
+
+    def _writer_loop(self) -> None:
+        """書き込みスレッド本体
+
+        キューから(パス, バイト列)を取り出してアトミック書き込みを行います。
+        Noneセンチネルで終了します。
+        """
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                filepath, payload = item
+                try:
+                    _atomic_write_bytes(filepath, payload)
+                except Exception:
+                    self._stats['async_write_errors'] += 1
+            finally:
+                self._write_queue.task_done()
+
+    def flush(self) -> None:
+        """保留中の非同期書き込みをすべて完了させる
+
+        インタプリタ終了時にデーモンスレッドがtask_done()を呼ばずに
+        停止している場合があるため、スレッドが生きているときだけ
+        Queue.join()で待ちます（デッドロック防止）。
+        """
+        if (self._write_queue is not None and self._writer is not None
+                and self._writer.is_alive()):
+            self._write_queue.join()
+
+    def close(self) -> None:
+        """書き込みスレッドを安全に停止
+
+        保留中の書き込みを完了させてからスレッドを終了します。
+        """
+        if self._writer is None:
+            return
+
+        if self._writer.is_alive():
+            self.flush()
+            self._write_queue.put(None)
+            self._writer.join()
+        self._writer = None
+        self._write_queue = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _drop_hash(self, name: str) -> None:
+        """名前に紐づく内容ハッシュの参照を解放
+
+        参照が残っている間は、_by_hashの正規名が削除された名前を
+        指し続けないよう、生存している別名に付け替えます。
+
+        Args:
+            name: スナップショット名
+        """
+        digest = self._snapshot_hashes.pop(name, None)
+        if digest is None:
+            return
+
+        remaining = self._hash_refs.get(digest, 1) - 1
+        if remaining <= 0:
+            self._hash_refs.pop(digest, None)
+            self._by_hash.pop(digest, None)
+            return
+
+        self._hash_refs[digest] = remaining
+        if self._by_hash.get(digest) == name:
+            for other, other_digest in self._snapshot_hashes.items():
+                if other_digest == digest:
+                    self._by_hash[digest] = other
+                    break
+
+    def _put_snapshot(self, name: str, snapshot: StateSnapshot,
+                      refresh_order: bool = True) -> None:
+        """スナップショットをLRUキャッシュに登録し、容量超過分を退避
+
+        Args:
+            name: スナップショット名
+            snapshot: 登録するスナップショット
+            refresh_order: Trueの場合、一覧表示用の作成順を最新に更新する
+                （退避からの再ロードでは作成順を変えないようFalseを渡す）
+        """
+        self._snapshots[name] = snapshot
+        self._snapshots.move_to_end(name)
+        if refresh_order:
+            self._snapshot_order[name] = None
+            self._snapshot_order.move_to_end(name)
+
+        capacity = self.max_in_memory_snapshots
+        if capacity is None:
+            return
+
+        # メモリ常駐数が上限を超えたら、LRU順にディスクへ退避
+        in_memory = sum(1 for v in self._snapshots.values()
+                        if isinstance(v, StateSnapshot))
+        if in_memory <= capacity:
+            return
+
+        for lru_name, entry in list(self._snapshots.items()):
+            if in_memory <= capacity:
+                break
+            if not isinstance(entry, StateSnapshot) or lru_name == name:
+                continue
+            filepath = self.base_directory / f"{lru_name}.lru.json"
+            data = {'type': 'snapshot', 'data': entry.to_dict()}
+            _atomic_write_bytes(filepath, _serialize_state_file(data, 'json'))
+            self._snapshots[lru_name] = _OnDisk(filepath, entry.metadata)
+            in_memory -= 1
+
+    def _get_snapshot(self, name: str) -> StateSnapshot:
+        """スナップショットを取得（退避済みなら再ロード）
+
+        Args:
+            name: スナップショット名
+
+        Returns:
+            StateSnapshotインスタンス
+
+        Raises:
+            StateManagerError: スナップショットが存在しない場合
+        """
+        entry = self._snapshots.get(name)
+        if entry is None:
+            raise StateManagerError(f"Snapshot '{name}' not found")
+
+        if isinstance(entry, _OnDisk):
+            data = _read_envelope(entry.filepath)
+            snapshot = StateSnapshot.from_dict(data['data'])
+            self._put_snapshot(name, snapshot, refresh_order=False)
+            # メモリへ昇格した退避ファイルは孤児にならないよう削除
+            try:
+                os.unlink(entry.filepath)
+            except OSError:
+                pass
+            entry = snapshot
+        else:
+            self._snapshots.move_to_end(name)
+
+        return entry
+
     def create_snapshot(self, device: Device, name: str, description: str = "") -> StateSnapshot:
         """デバイス状態のスナップショットを作成
         
@@ -171,21 +699,45 @@ class StateManager:
         try:
             # デバイスから状態を取得
             state = device.get_state()
-            
-            # メタデータを作成
+
+            # メタデータを作成（重複排除時も名前ごとに保持する）
             metadata = {
                 'description': description,
                 'device_name': getattr(device, 'name', 'Unknown'),
                 'created_at': datetime.now().isoformat(),
                 'version': '1.0'
             }
-            
+
+            # 内容ハッシュで既存スナップショットと重複排除
+            digest = _state_digest(state)
+            self._drop_hash(name)
+            if digest is not None:
+                existing_name = self._by_hash.get(digest)
+                if existing_name is not None and existing_name in self._snapshots:
+                    # 同一内容: 凍結済み状態のみ共有し、メタデータは固有に持つ
+                    existing = self._get_snapshot(existing_name)
+                    snapshot = StateSnapshot.__new__(StateSnapshot)
+                    snapshot.name = name
+                    snapshot.state = existing.state
+                    snapshot.metadata = metadata
+                    self._put_snapshot(name, snapshot)
+                    self._snapshot_hashes[name] = digest
+                    self._hash_refs[digest] = self._hash_refs.get(digest, 0) + 1
+                    self._current_snapshot = name
+                    self._stats['snapshots_created'] += 1
+                    return snapshot
+
             # スナップショットを作成
             snapshot = StateSnapshot(name, state, metadata)
             
             # 内部管理に追加
-            self._snapshots[name] = snapshot
+            self._put_snapshot(name, snapshot)
             self._current_snapshot = name
+
+            if digest is not None:
+                self._by_hash[digest] = name
+                self._snapshot_hashes[name] = digest
+                self._hash_refs[digest] = self._hash_refs.get(digest, 0) + 1
             
             # 統計更新
             self._stats['snapshots_created'] += 1
@@ -195,24 +747,125 @@ class StateManager:
         except Exception as e:
             raise StateManagerError(f"Failed to create snapshot '{name}': {e}")
     
+    def create_delta_snapshot(self, device: Device, name: str, base: str,
+                              description: str = "") -> StateSnapshot:
+        """基準スナップショットとの差分のみを記録するスナップショットを作成
+
+        「レジスタを1つ変更してはスナップショット」という典型的な
+        ワークフローで全状態を重複保存しないよう、基準との間で
+        異なるレジスタのみを記録します。復元時はbaseチェーンを
+        ルートまで辿って線形に再構築します。
+
+        Args:
+            device: 状態を取得するデバイス
+            name: スナップショット名
+            base: 差分の基準となる既存スナップショット名
+            description: スナップショットの説明
+
+        Returns:
+            作成されたStateSnapshot（差分形式）
+
+        Raises:
+            StateManagerError: 基準が存在しないか作成に失敗した場合
+        """
+        if base not in self._snapshots:
+            raise StateManagerError(f"Base snapshot '{base}' not found")
+
+        try:
+            new_state = device.get_state()
+            base_state = self._resolve_snapshot_state(base)
+
+            old_regs = base_state.get('registers', [])
+            new_regs = new_state.get('registers', [])
+            changes = {i: v for i, v in enumerate(new_regs)
+                       if i >= len(old_regs) or v != old_regs[i]}
+
+            metadata = {
+                'description': description,
+                'device_name': getattr(device, 'name', 'Unknown'),
+                'created_at': datetime.now().isoformat(),
+                'version': '1.0',
+                'base': base
+            }
+
+            snapshot = StateSnapshot(name, {'register_changes': changes}, metadata)
+            self._put_snapshot(name, snapshot)
+            self._current_snapshot = name
+            self._stats['snapshots_created'] += 1
+
+            return snapshot
+
+        except StateManagerError:
+            raise
+        except Exception as e:
+            raise StateManagerError(f"Failed to create delta snapshot '{name}': {e}")
+
+    def _resolve_snapshot_state(self, name: str) -> Dict[str, Any]:
+        """スナップショットの完全な状態を再構築
+
+        差分スナップショットの場合はbaseチェーンをルートの
+        完全スナップショットまで辿り、差分を順に適用します。
+
+        Args:
+            name: 再構築するスナップショット名
+
+        Returns:
+            完全な状態辞書
+
+        Raises:
+            StateManagerError: チェーンが壊れているか循環している場合
+        """
+        # ルートまでのチェーンを収集（循環検出付き）
+        chain = []
+        current = name
+        seen = set()
+        while True:
+            if current in seen:
+                raise StateManagerError(f"Snapshot base chain contains a cycle at '{current}'")
+            seen.add(current)
+
+            if current not in self._snapshots:
+                raise StateManagerError(f"Snapshot '{current}' not found in base chain of '{name}'")
+
+            snapshot = self._get_snapshot(current)
+            base = snapshot.metadata.get('base')
+            if base is None:
+                break
+            chain.append(snapshot)
+            current = base
+
+        # ルートの完全状態から差分を古い順に適用
+        # apply_to_stateが内部でコピーするため、ここでは読み取り専用ビューのまま渡す
+        state = self._get_snapshot(current).state
+        for snapshot in reversed(chain):
+            changes = snapshot.state.get('register_changes', {})
+            patch = StatePatch(snapshot.name, {int(k): v for k, v in changes.items()})
+            state = patch.apply_to_state(state)
+
+        return state
+
     def restore_snapshot(self, device: Device, name: str) -> None:
         """スナップショットをデバイスに復元
-        
+
+        差分スナップショットの場合はbaseチェーンから完全な状態を
+        再構築してから復元します。
+
         Args:
             device: 復元対象のデバイス
             name: 復元するスナップショット名
-            
+
         Raises:
             StateManagerError: 復元に失敗した場合
         """
         if name not in self._snapshots:
             raise StateManagerError(f"Snapshot '{name}' not found")
-        
+
         try:
-            snapshot = self._snapshots[name]
-            device.set_state(snapshot.state)
+            device.set_state(_thaw_registers(self._resolve_snapshot_state(name)))
             self._current_snapshot = name
-            
+
+        except StateManagerError:
+            raise
         except Exception as e:
             raise StateManagerError(f"Failed to restore snapshot '{name}': {e}")
     
@@ -230,16 +883,37 @@ class StateManager:
         Raises:
             StateManagerError: パッチ作成に失敗した場合
         """
-        # レジスタアドレスの検証
-        for address in register_changes.keys():
-            if not (0 <= address <= 15):
-                raise StateManagerError(f"Invalid register address: {address}")
-        
-        # レジスタ値の検証
-        for value in register_changes.values():
-            if not (0 <= value <= 255):
-                raise StateManagerError(f"Invalid register value: {value}")
-        
+        if len(register_changes) <= 1:
+            # 単一要素はNumPy配列化のオーバーヘッドの方が高い
+            for address, value in register_changes.items():
+                if not (0 <= address <= 15):
+                    raise StateManagerError(f"Invalid register address: {address}")
+                if not (0 <= value <= 255):
+                    raise StateManagerError(f"Invalid register value: {value}")
+        else:
+            # 複数要素は一括ベクトル化検証
+            # dtypeはint64: 範囲チェック前の配列化でOverflowErrorにしないため
+            count = len(register_changes)
+            try:
+                addrs = np.fromiter(register_changes.keys(), dtype=np.int64, count=count)
+                vals = np.fromiter(register_changes.values(), dtype=np.int64, count=count)
+            except OverflowError:
+                # int64にも収まらない値は範囲外として扱う
+                for address, value in register_changes.items():
+                    if not (0 <= address <= 15):
+                        raise StateManagerError(f"Invalid register address: {address}")
+                    if not (0 <= value <= 255):
+                        raise StateManagerError(f"Invalid register value: {value}")
+                raise StateManagerError("Invalid register changes")
+
+            if ((addrs < 0) | (addrs > 15)).any():
+                bad = addrs[(addrs < 0) | (addrs > 15)][0]
+                raise StateManagerError(f"Invalid register address: {bad}")
+
+            if ((vals < 0) | (vals > 255)).any():
+                bad = vals[(vals < 0) | (vals > 255)][0]
+                raise StateManagerError(f"Invalid register value: {bad}")
+
         patch = StatePatch(name, register_changes, description)
         self._patches[name] = patch
         
@@ -260,53 +934,91 @@ class StateManager:
         
         try:
             patch = self._patches[patch_name]
-            
-            # レジスタ変更を適用
-            for address, value in patch.register_changes.items():
-                device.write_register(address, value)
-            
+
+            # レジスタ変更を適用（バッチ書き込みがあれば1回の呼び出しで）
+            # アドレス昇順で適用し、R13等の副作用順序を決定的に保つ
+            if hasattr(device, 'write_registers'):
+                device.write_registers(dict(sorted(patch.register_changes.items())))
+            else:
+                for address, value in sorted(patch.register_changes.items()):
+                    device.write_register(address, value)
+
             # 統計更新
             self._stats['patches_applied'] += 1
             
         except Exception as e:
             raise StateManagerError(f"Failed to apply patch '{patch_name}': {e}")
     
-    def save_snapshot_to_file(self, snapshot_name: str, filename: str = None) -> str:
+    def save_snapshot_to_file(self, snapshot_name: str, filename: str = None,
+                              format: str = 'json',
+                              external_registers: bool = False,
+                              compress: bool = False) -> str:
         """スナップショットをファイルに保存
-        
+
         Args:
             snapshot_name: 保存するスナップショット名
             filename: 保存ファイル名（Noneで自動生成）
-            
+            format: ファイルフォーマット ('json' または 'msgpack')
+            external_registers: Trueの場合、レジスタ配列を固定長バイナリの
+                サイドカーファイル (*.regs.bin) に書き出し、本体には
+                参照のみを残します。本体のパースがレジスタ長に依存しなくなり、
+                バイナリ側はシーケンシャルなブロック読みになります。
+            compress: Trueの場合、本体をzstd (level=3) で圧縮して
+                *.zstとして保存します。読み込みは透過的に展開されます。
+
         Returns:
             保存されたファイルパス
-            
+
         Raises:
             StateManagerError: 保存に失敗した場合
         """
         if snapshot_name not in self._snapshots:
             raise StateManagerError(f"Snapshot '{snapshot_name}' not found")
-        
+
         if filename is None:
-            filename = f"{snapshot_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
+            ext = 'msgpack' if format == 'msgpack' else 'json'
+            filename = f"{snapshot_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+
+        if compress and not filename.endswith('.zst'):
+            filename += '.zst'
+
         filepath = self.base_directory / filename
-        
+
         try:
-            snapshot = self._snapshots[snapshot_name]
+            snapshot = self._get_snapshot(snapshot_name)
+            payload = snapshot.to_dict()
+
+            if external_registers:
+                state = dict(payload['state'])
+                regs = state.pop('registers', None)
+                if regs is None and 'registers_b64' in state:
+                    regs = base64.b64decode(state.pop('registers_b64'))
+                if regs is not None:
+                    regs_path = filepath.with_suffix('.regs.bin')
+                    arr = np.asarray(bytearray(regs) if isinstance(regs, bytes)
+                                     else list(regs), dtype=np.uint8)
+                    _atomic_write_bytes(regs_path, arr.tobytes())
+                    state['registers_ref'] = regs_path.name
+                    state['registers_dtype'] = 'u1'
+                    state['registers_shape'] = [int(arr.size)]
+                    payload = dict(payload)
+                    payload['state'] = state
+
             data = {
                 'type': 'snapshot',
-                'data': snapshot.to_dict()
+                'data': payload
             }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
+
+            serialized = _serialize_state_file(data, format)
+            if filepath.suffix == '.zst':
+                serialized = _compress_payload(serialized)
+            self._write_file(filepath, serialized)
+
             # 統計更新
             self._stats['files_saved'] += 1
-            
+
             return str(filepath)
-            
+
         except Exception as e:
             raise StateManagerError(f"Failed to save snapshot to '{filepath}': {e}")
     
@@ -328,62 +1040,83 @@ class StateManager:
             raise StateManagerError(f"File not found: {filepath}")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _read_envelope(filepath)
+
             if data.get('type') != 'snapshot':
                 raise StateManagerError(f"Invalid file format: {filepath}")
-            
+
+            # サイドカー参照形式のレジスタを復元
+            state = data['data'].get('state', {})
+            if 'registers_ref' in state:
+                regs_path = filepath.parent / state['registers_ref']
+                dtype = state.get('registers_dtype', 'u1')
+                arr = np.fromfile(regs_path, dtype=np.dtype(dtype))
+                state = dict(state)
+                for key in ('registers_ref', 'registers_dtype', 'registers_shape'):
+                    state.pop(key, None)
+                state['registers'] = arr.tolist()
+                data['data'] = dict(data['data'])
+                data['data']['state'] = state
+
             snapshot = StateSnapshot.from_dict(data['data'])
-            self._snapshots[snapshot.name] = snapshot
-            
+            self._put_snapshot(snapshot.name, snapshot)
+
             # 統計更新
             self._stats['snapshots_loaded'] += 1
             self._stats['files_loaded'] += 1
-            
+
             return snapshot.name
-            
-        except json.JSONDecodeError as e:
-            raise StateManagerError(f"Invalid JSON in file '{filepath}': {e}")
+
+        except StateManagerError:
+            raise
         except Exception as e:
             raise StateManagerError(f"Failed to load snapshot from '{filepath}': {e}")
     
-    def save_patch_to_file(self, patch_name: str, filename: str = None) -> str:
+    def save_patch_to_file(self, patch_name: str, filename: str = None,
+                           format: str = 'json', compress: bool = False) -> str:
         """パッチをファイルに保存
-        
+
         Args:
             patch_name: 保存するパッチ名
             filename: 保存ファイル名（Noneで自動生成）
-            
+            format: ファイルフォーマット ('json' または 'msgpack')
+            compress: Trueの場合、zstd圧縮して*.zstとして保存
+
         Returns:
             保存されたファイルパス
-            
+
         Raises:
             StateManagerError: 保存に失敗した場合
         """
         if patch_name not in self._patches:
             raise StateManagerError(f"Patch '{patch_name}' not found")
-        
+
         if filename is None:
-            filename = f"patch_{patch_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
+            ext = 'msgpack' if format == 'msgpack' else 'json'
+            filename = f"patch_{patch_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+
+        if compress and not filename.endswith('.zst'):
+            filename += '.zst'
+
         filepath = self.base_directory / filename
-        
+
         try:
             patch = self._patches[patch_name]
             data = {
                 'type': 'patch',
                 'data': patch.to_dict()
             }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
+
+            serialized = _serialize_state_file(data, format)
+            if filepath.suffix == '.zst':
+                serialized = _compress_payload(serialized)
+            self._write_file(filepath, serialized)
+
             # 統計更新
             self._stats['files_saved'] += 1
-            
+
             return str(filepath)
-            
+
         except Exception as e:
             raise StateManagerError(f"Failed to save patch to '{filepath}': {e}")
     
@@ -405,62 +1138,75 @@ class StateManager:
             raise StateManagerError(f"File not found: {filepath}")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _read_envelope(filepath)
+
             if data.get('type') != 'patch':
                 raise StateManagerError(f"Invalid file format: {filepath}")
-            
+
             patch = StatePatch.from_dict(data['data'])
             self._patches[patch.name] = patch
-            
+
             # 統計更新
             self._stats['files_loaded'] += 1
-            
+
             return patch.name
-            
-        except json.JSONDecodeError as e:
-            raise StateManagerError(f"Invalid JSON in file '{filepath}': {e}")
+
+        except StateManagerError:
+            raise
         except Exception as e:
             raise StateManagerError(f"Failed to load patch from '{filepath}': {e}")
     
-    def list_snapshots(self) -> List[Dict[str, Any]]:
-        """スナップショット一覧を取得
-        
-        Returns:
-            スナップショット情報のリスト
+    def iter_snapshots(self):
+        """スナップショット情報を新しい順に生成
+
+        辞書の挿入/アクセス順を逆順に辿るため、ソートなしで
+        最近のエントリから列挙できます（退避済みエントリは
+        保持しているメタデータのみを参照し、再ロードしません）。
+
+        Yields:
+            スナップショット情報辞書
         """
-        snapshots = []
-        for name, snapshot in self._snapshots.items():
-            info = {
+        for name in reversed(self._snapshot_order):
+            entry = self._snapshots[name]
+            yield {
                 'name': name,
-                'description': snapshot.metadata.get('description', ''),
-                'created_at': snapshot.metadata.get('created_at', ''),
-                'device_name': snapshot.metadata.get('device_name', ''),
+                'description': entry.metadata.get('description', ''),
+                'created_at': entry.metadata.get('created_at', ''),
+                'device_name': entry.metadata.get('device_name', ''),
                 'is_current': name == self._current_snapshot
             }
-            snapshots.append(info)
-        
-        return sorted(snapshots, key=lambda x: x['created_at'], reverse=True)
-    
-    def list_patches(self) -> List[Dict[str, Any]]:
-        """パッチ一覧を取得
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """スナップショット一覧を取得（新しい順）
         
         Returns:
-            パッチ情報のリスト
+            スナップショット情報のリスト
         """
-        patches = []
-        for name, patch in self._patches.items():
-            info = {
+        return list(self.iter_snapshots())
+    
+    def iter_patches(self):
+        """パッチ情報を新しい順に生成
+
+        Yields:
+            パッチ情報辞書
+        """
+        for name in reversed(self._patches):
+            patch = self._patches[name]
+            yield {
                 'name': name,
                 'description': patch.description,
                 'created_at': patch.created_at,
                 'register_count': len(patch.register_changes),
                 'registers': list(patch.register_changes.keys())
             }
-            patches.append(info)
+
+    def list_patches(self) -> List[Dict[str, Any]]:
+        """パッチ一覧を取得（新しい順）
         
-        return sorted(patches, key=lambda x: x['created_at'], reverse=True)
+        Returns:
+            パッチ情報のリスト
+        """
+        return list(self.iter_patches())
     
     def delete_snapshot(self, name: str) -> None:
         """スナップショットを削除
@@ -473,9 +1219,17 @@ class StateManager:
         """
         if name not in self._snapshots:
             raise StateManagerError(f"Snapshot '{name}' not found")
-        
-        del self._snapshots[name]
-        
+
+        entry = self._snapshots.pop(name)
+        self._snapshot_order.pop(name, None)
+        self._drop_hash(name)
+
+        if isinstance(entry, _OnDisk):
+            try:
+                os.unlink(entry.filepath)
+            except OSError:
+                pass
+
         if self._current_snapshot == name:
             self._current_snapshot = None
     
@@ -508,9 +1262,22 @@ class StateManager:
         }
     
     def clear_all(self) -> None:
-        """すべてのスナップショットとパッチをクリア"""
+        """すべてのスナップショットとパッチをクリア
+
+        ディスクに退避されたスナップショットの退避ファイルも削除します。
+        """
+        for entry in self._snapshots.values():
+            if isinstance(entry, _OnDisk):
+                try:
+                    os.unlink(entry.filepath)
+                except OSError:
+                    pass
         self._snapshots.clear()
+        self._snapshot_order.clear()
         self._patches.clear()
+        self._by_hash.clear()
+        self._snapshot_hashes.clear()
+        self._hash_refs.clear()
         self._current_snapshot = None
 
 
@@ -5,11 +5,46 @@ AY-3-8910 PSG エミュレータ - 音量テーブル
 AYUMI実装に準拠したチップ別の精密な実装により、正確なハードウェアエミュレーションを実現します。
 """
 
+import hashlib
+from functools import cached_property
 from typing import List, Union
 import math
 import numpy as np
 from ..core.types import InvalidValueError
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+def _interpolate_kernel(table, level):
+    """浮動小数点音量レベルをテーブルから線形補間するカーネル本体
+
+    Args:
+        table: 正規化浮動小数点テーブル (float32配列)
+        level: 音量レベル (0.0-31.0)
+
+    Returns:
+        補間された正規化浮動小数点値
+    """
+    lower_index = int(level)
+    upper_index = min(lower_index + 1, 31)
+    fraction = level - lower_index
+
+    lower_value = table[lower_index]
+    upper_value = table[upper_index]
+
+    return lower_value + fraction * (upper_value - lower_value)
+
+
+if NUMBA_AVAILABLE:
+    _interpolate = njit(cache=True)(_interpolate_kernel)
+else:
+    _interpolate = _interpolate_kernel
+
 
 class VolumeTable:
     """AY-3-8910/YM2149対数DAC音量変換テーブル（AYUMI準拠版）
@@ -104,24 +139,35 @@ class VolumeTable:
                 if not (0 <= value <= 65535):
                     raise InvalidValueError(f"Custom table value {i} out of range [0, 65535]: {value}")
             
-            self._pcm_table = custom_table.copy()
+            source_table = custom_table
         else:
             # AYUMI準拠: 常に32レベルテーブルを使用
-            self._pcm_table = self._YM_DAC_TABLE.copy()
-        
-        # 正規化された浮動小数点テーブルを生成
-        self._float_table = [value / 65535.0 for value in self._pcm_table]
+            source_table = self._YM_DAC_TABLE
 
-        # NumPy配列版（ベクトル化用）
-        self._float_array = np.array(self._float_table, dtype=np.float32)
-        self._pcm_array = np.array(self._pcm_table, dtype=np.int32)
+        # NumPy配列を正本とし、リスト形式は必要時に遅延生成する
+        self._pcm_array = np.asarray(source_table, dtype=np.uint16)
+        self._float_array = self._pcm_array.astype(np.float32) / np.float32(65535.0)
 
         # テーブルの妥当性を検証
         self._validate_table()
+
+        # テーブルは初期化後に不変のため、文字列表現を先に確定
+        self._str_cache = (f"VolumeTable({self._chip_type}, "
+                           f"{self.get_dynamic_range_db():.1f}dB range)")
+
+    @cached_property
+    def _pcm_table(self) -> List[int]:
+        """PCMテーブルのリスト形式（遅延生成・キャッシュ付き）"""
+        return self._pcm_array.tolist()
+
+    @cached_property
+    def _float_table(self) -> List[float]:
+        """正規化浮動小数点テーブルのリスト形式（遅延生成・キャッシュ付き）"""
+        return (self._pcm_array / 65535.0).tolist()
     
     def _validate_table(self) -> None:
         """テーブルの妥当性を検証（AYUMI準拠）"""
-        table_size = len(self._pcm_table)
+        table_size = len(self._pcm_array)
         
         # 単調増加の確認
         for i in range(1, table_size):
@@ -157,7 +203,7 @@ class VolumeTable:
         if not (0 <= volume_level <= max_level):
             raise InvalidValueError(f"Volume level {volume_level} out of range [0, {max_level}] (AYUMI準拠)")
         
-        return self._pcm_table[volume_level]
+        return int(self._pcm_array[volume_level])
     
     def lookup_float(self, volume_level: int) -> float:
         """4ビット音量値を正規化浮動小数点値に変換
@@ -176,7 +222,7 @@ class VolumeTable:
         if not (0 <= volume_level <= max_level):
             raise InvalidValueError(f"Volume level {volume_level} out of range [0, {max_level}] (AYUMI準拠)")
         
-        return self._float_table[volume_level]
+        return float(self._float_array[volume_level])
     
     def get_chip_type(self) -> str:
         """チップタイプを取得
@@ -192,7 +238,7 @@ class VolumeTable:
         Returns:
             テーブルサイズ (16 for AY-3-8910, 32 for YM2149)
         """
-        return len(self._pcm_table)
+        return len(self._pcm_array)
     
     def get_max_volume_level(self) -> int:
         """最大音量レベルを取得
@@ -200,7 +246,7 @@ class VolumeTable:
         Returns:
             最大音量レベル (15 for AY-3-8910, 31 for YM2149)
         """
-        return len(self._pcm_table) - 1
+        return len(self._pcm_array) - 1
     
     def lookup(self, volume_level: int) -> int:
         """lookup_pcm のエイリアス（後方互換性）
@@ -229,30 +275,39 @@ class VolumeTable:
         normalized = self.lookup_float(volume_level)
         return (normalized * 2.0) - 1.0  # 0.0-1.0 を -1.0〜1.0 に変換
     
-    def get_table_copy(self) -> List[int]:
-        """PCMテーブルのコピーを取得
-        
-        Returns:
-            PCMテーブルのコピー
-        """
-        return self._pcm_table.copy()
-    
-    def get_float_table_copy(self) -> List[float]:
-        """浮動小数点テーブルのコピーを取得
-        
+    def get_table_copy(self) -> np.ndarray:
+        """PCMテーブルの読み取り専用ビューを取得
+
+        以前はリストのコピーを返していましたが、呼び出し毎の
+        アロケーションを避けるため読み取り専用のNumPyビューを
+        返すようになりました。可変コピーが必要な場合は
+        呼び出し側で.copy()してください。
+
         Returns:
-            浮動小数点テーブルのコピー
+            PCMテーブル（uint16、writeable=False）
         """
-        return self._float_table.copy()
-    
-    def is_mame_compatible(self) -> bool:
-        """MAMEテーブルと互換性があるかチェック
-        
+        view = self._pcm_array.view()
+        view.flags.writeable = False
+        return view
+
+    def get_float_table_copy(self) -> np.ndarray:
+        """浮動小数点テーブルの読み取り専用ビューを取得
+
+        get_table_copyと同様、アロケーション回避のため
+        読み取り専用のNumPyビューを返します。
+
         Returns:
-            MAMEテーブルと同じ値を持つ場合True
+            浮動小数点テーブル（float32、writeable=False）
         """
-        return self._pcm_table == self._MAME_VOLUME_TABLE
+        view = self._float_array.view()
+        view.flags.writeable = False
+        return view
     
+    @cached_property
+    def _signature(self) -> str:
+        """テーブル内容の短い署名（識別・ログ用）"""
+        return hashlib.sha256(self._pcm_array.tobytes()).hexdigest()[:8]
+
     def get_dynamic_range_db(self) -> float:
         """ダイナミックレンジをdBで計算
         
@@ -287,16 +342,36 @@ class VolumeTable:
         if not (0.0 <= volume_level <= 31.0):
             raise InvalidValueError(f"Volume level {volume_level} out of range [0.0, 31.0] (AYUMI準拠)")
 
-        # 整数部分と小数部分を分離
-        lower_index = int(volume_level)
-        upper_index = min(lower_index + 1, 31)
-        fraction = volume_level - lower_index
+        # 線形補間（Numbaが利用可能ならJITカーネル）
+        return float(_interpolate(self._float_array, volume_level))
 
-        # 線形補間
-        lower_value = self._float_table[lower_index]
-        upper_value = self._float_table[upper_index]
+    def interpolate_volume_vectorized(self, volume_levels: np.ndarray) -> np.ndarray:
+        """浮動小数点音量レベル配列を一括線形補間（NumPy最適化版）
 
-        return lower_value + fraction * (upper_value - lower_value)
+        エンベロープスイープのようにサンプル単位で補間が必要な場合に、
+        スカラー版のPython呼び出しオーバーヘッドを回避します。
+
+        Args:
+            volume_levels: 浮動小数点音量レベルの配列 (0.0-31.0)
+
+        Returns:
+            補間された正規化浮動小数点値の配列 (0.0-1.0)
+
+        Note:
+            範囲外の入力は [0.0, 31.0] にクリップされます
+            （スカラー版interpolate_volumeの範囲検証に対応する
+            分岐レスな扱い）。
+        """
+        levels = np.clip(np.asarray(volume_levels, dtype=np.float32),
+                         np.float32(0.0), np.float32(31.0))
+
+        lower = levels.astype(np.int32)
+        upper = np.minimum(lower + 1, 31)
+        # float32 - int32 はfloat64へ昇格するため、float32同士で差を取る
+        fraction = levels - lower.astype(np.float32)
+
+        lower_values = self._float_array[lower]
+        return lower_values + fraction * (self._float_array[upper] - lower_values)
 
     # =========================================================================
     # NumPy最適化メソッド（Phase 1最適化）
@@ -313,10 +388,12 @@ class VolumeTable:
 
         Note:
             この関数は50-100倍高速化が期待できます。
-            範囲外の値は自動的にクランプされます。
+            範囲外の値は [0, 31] に飽和（クランプ）されます。
         """
-        # 範囲を0-31にクランプ
-        clamped = np.clip(volume_levels, 0, 31)
+        # 飽和クランプ: ラップではなく端の値に張り付ける
+        # （負値は無音、32以上は最大音量）。uint8へ狭めるのはクリップ後
+        clamped = np.clip(np.asarray(volume_levels, dtype=np.int64),
+                          0, 31).astype(np.uint8)
 
         # NumPy配列のインデックス参照で一括変換（超高速）
         return self._float_array[clamped]
@@ -328,10 +405,14 @@ class VolumeTable:
             volume_levels: 音量レベルの配列 (0-31)
 
         Returns:
-            16ビットPCM値の配列 (0-65535)
+            16ビットPCM値の配列 (0-65535、uint16)
+
+        Note:
+            範囲外の値は [0, 31] に飽和（クランプ）されます。
         """
-        # 範囲を0-31にクランプ
-        clamped = np.clip(volume_levels, 0, 31)
+        # 飽和クランプ: ラップではなく端の値に張り付ける
+        clamped = np.clip(np.asarray(volume_levels, dtype=np.int64),
+                          0, 31).astype(np.uint8)
 
         # NumPy配列のインデックス参照で一括変換
         return self._pcm_array[clamped]
@@ -353,10 +434,8 @@ class VolumeTable:
         return self._pcm_array
     
     def __str__(self) -> str:
-        """文字列表現"""
-        table_type = "MAME" if self.is_mame_compatible() else "Custom"
-        dynamic_range = self.get_dynamic_range_db()
-        return f"VolumeTable({table_type}, {dynamic_range:.1f}dB range)"
+        """文字列表現（初期化時に確定済み）"""
+        return self._str_cache
     
     def __repr__(self) -> str:
         """詳細文字列表現"""
@@ -367,36 +446,6 @@ class VolumeTable:
 # ファクトリ関数
 # =============================================================================
 
-def create_mame_volume_table() -> VolumeTable:
-    """MAME準拠の音量テーブルを作成
-    
-    Returns:
-        MAME準拠のVolumeTableインスタンス
-    """
-    return VolumeTable(use_mame_table=True)
-
-
-def create_linear_volume_table() -> VolumeTable:
-    """線形音量テーブルを作成（デバッグ用）
-    
-    Returns:
-        線形VolumeTableインスタンス
-    """
-    return VolumeTable(use_mame_table=False)
-
-
-def create_custom_volume_table(table: List[int]) -> VolumeTable:
-    """カスタム音量テーブルを作成
-    
-    Args:
-        table: 16要素のPCM値リスト
-        
-    Returns:
-        カスタムVolumeTableインスタンス
-    """
-    return VolumeTable(use_mame_table=False, custom_table=table)
-
-
 def create_ay_volume_table(custom_table: List[int] = None) -> VolumeTable:
     """AY-3-8910用音量テーブルを作成
     
@@ -446,18 +495,18 @@ def create_exponential_volume_table(base: float = 2.0) -> VolumeTable:
     if base <= 1.0:
         raise InvalidValueError(f"Exponential base must be > 1.0, got {base}")
     
-    # 指数関数テーブルを生成
+    # 指数関数テーブルを生成（AYUMI準拠の32レベル）
     table = []
-    for i in range(16):
+    for i in range(32):
         if i == 0:
             table.append(0)  # 無音
         else:
-            # 指数関数: y = (base^i - 1) / (base^15 - 1) * 65535
-            normalized = (base ** i - 1) / (base ** 15 - 1)
+            # 指数関数: y = (base^i - 1) / (base^31 - 1) * 65535
+            normalized = (base ** i - 1) / (base ** 31 - 1)
             pcm_value = int(normalized * 65535)
             table.append(min(pcm_value, 65535))
     
-    return VolumeTable(use_mame_table=False, custom_table=table)
+    return VolumeTable(custom_table=table)
 
 
 def create_ay_volume_table(custom_table: List[int] = None) -> VolumeTable: